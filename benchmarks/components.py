@@ -0,0 +1,192 @@
+"""Benchmark mod card and date section rendering on synthetic rows.
+
+Compares the components, which escape their text and URLs, with the
+unescaped f-strings they replaced and with the same f-strings escaped
+through html.escape. Run from the repository root:
+
+    python -m benchmarks.components [--rows N] [--repeat N]
+"""
+
+import argparse
+import gc
+import html
+import random
+import string
+import time
+from typing import Callable, Optional
+
+from scripts.components import date_section, mod_card
+
+FALLBACK_IMAGE = "https://placehold.co/80x45/e2e8f0/64748b?text=No+Image"
+LINK_ICON = """<svg class="mod-link-icon" viewBox="0 0 16 16" fill="none" stroke="currentColor" stroke-width="1.5"><path d="M6 10L14 2m0 0h-5m5 0v5M8 4H3a1 1 0 00-1 1v8a1 1 0 001 1h8a1 1 0 001-1V9"/></svg>"""
+
+# Rows per date section, split evenly between the New and Updated panels
+ROWS_PER_DAY = 1000
+
+Row = tuple[str, str, Optional[str], Optional[str], tuple[str, ...]]
+
+
+def fstring_mod_card(
+    title: str,
+    summary: str,
+    image_url: Optional[str] = None,
+    profile_url: Optional[str] = None,
+    platforms: tuple[str, ...] = (),
+    escape: Callable[[str], str] = lambda value: value,
+) -> str:
+    """The mod card as it was built before escaping, optionally escaped with escape."""
+    img_src = escape(image_url or FALLBACK_IMAGE)
+    tag = "a" if profile_url else "div"
+    href = (
+        f'href="{escape(profile_url)}" target="_blank" rel="noopener noreferrer"'
+        if profile_url
+        else ""
+    )
+    link_icon = LINK_ICON if profile_url else ""
+    return f"""<{tag} class="mod-row" data-platforms="{" ".join(platforms)}" {href}>
+            <img class="mod-thumb" src="{img_src}" alt="" loading="lazy" onerror="this.src='{FALLBACK_IMAGE}'">
+            <div class="mod-info">
+                <div class="mod-title">{escape(title)}</div>
+                <div class="mod-summary">{escape(summary)}</div>
+            </div>
+            {link_icon}
+        </{tag}>"""
+
+
+def fstring_date_section(
+    date_str: str,
+    new_count: int,
+    updated_count: int,
+    content_new: str,
+    content_updated: str,
+    is_first: bool = False,
+) -> str:
+    """The date section as it was built before escaping."""
+    active = "active" if is_first else ""
+    default_tab = "new" if new_count > 0 else "updated"
+    new_active = "active" if default_tab == "new" else ""
+    updated_active = "active" if default_tab == "updated" else ""
+    return f"""<div class="date-section {active}" data-date="{date_str}" data-new-count="{new_count}" data-updated-count="{updated_count}" data-default-tab="{default_tab}">
+            <div class="date-content">
+                <div class="tab-bar">
+                    <div class="tab-group">
+                        <button class="tab-button {new_active}" data-tab="new" onclick="switchTab('new')">
+                            <span>New</span>
+                            <span class="tab-count">{new_count}</span>
+                        </button>
+                        <button class="tab-button {updated_active}" data-tab="updated" onclick="switchTab('updated')">
+                            <span>Updated</span>
+                            <span class="tab-count">{updated_count}</span>
+                        </button>
+                    </div>
+                </div>
+                <div class="tab-panels">
+                    <div class="tab-panel {new_active}" data-panel="new">
+                        <div class="mod-list">{content_new}</div>
+                    </div>
+                    <div class="tab-panel {updated_active}" data-panel="updated">
+                        <div class="mod-list">{content_updated}</div>
+                    </div>
+                </div>
+            </div>
+        </div>"""
+
+
+def synthetic_rows(mods: int, rows: int, seed: int = 1) -> list[Row]:
+    """rows card inputs drawn from mods synthetic mods, like a long history."""
+    rng = random.Random(seed)
+
+    def words(count: int) -> str:
+        return " ".join(
+            "".join(rng.choices(string.ascii_letters, k=rng.randint(3, 10)))
+            for _ in range(count)
+        )
+
+    catalogue = [
+        (
+            words(3),
+            words(15) + (" & co's" if i % 7 == 0 else ""),
+            f"https://thumb.modcdn.io/mods/{i}/thumb_320x180.png" if i % 5 else None,
+            f"https://mod.io/g/baldursgate3/m/mod-{i}" if i % 11 else None,
+            ("ps5", "xboxseriesx")[: 1 + i % 2],
+        )
+        for i in range(mods)
+    ]
+    if mods == rows:
+        return catalogue
+    return [rng.choice(catalogue) for _ in range(rows)]
+
+
+def render_page(rows: list[Row], card: Callable[..., str], section: Callable[..., str]) -> int:
+    """Render rows as cards grouped into date sections; returns the output size."""
+    size = 0
+    half = ROWS_PER_DAY // 2
+    for start in range(0, len(rows), ROWS_PER_DAY):
+        cards = [
+            card(title, summary, image_url, profile_url, platforms=platforms)
+            for title, summary, image_url, profile_url, platforms in rows[
+                start : start + ROWS_PER_DAY
+            ]
+        ]
+        size += len(
+            section(
+                "January 01, 2026",
+                len(cards[:half]),
+                len(cards[half:]),
+                "\n".join(cards[:half]),
+                "\n".join(cards[half:]),
+                start == 0,
+            )
+        )
+    return size
+
+
+def bench(rows: list[Row], card: Callable[..., str], section: Callable[..., str], repeat: int) -> float:
+    """Best time over repeat runs, in seconds."""
+    best = float("inf")
+    for _ in range(repeat):
+        gc.collect()
+        gc.disable()
+        try:
+            started = time.perf_counter()
+            render_page(rows, card, section)
+            best = min(best, time.perf_counter() - started)
+        finally:
+            gc.enable()
+    return best
+
+
+def main(argv: Optional[list[str]] = None):
+    """CLI entry point."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=100_000, help="rows per run")
+    parser.add_argument("--repeat", type=int, default=5, help="runs per case, best is kept")
+    args = parser.parse_args(argv)
+
+    def escaped_fstring_card(*row, platforms=()):
+        return fstring_mod_card(*row, platforms=platforms, escape=html.escape)
+
+    variants = [
+        ("f-string, unescaped (before)", fstring_mod_card, fstring_date_section),
+        ("f-string + html.escape", escaped_fstring_card, fstring_date_section),
+        ("f-string + escape (now)", mod_card, date_section),
+    ]
+    datasets = [
+        (f"{args.rows:,} rows, {args.rows // 10:,} mods", synthetic_rows(args.rows // 10, args.rows)),
+        (f"{args.rows:,} distinct rows", synthetic_rows(args.rows, args.rows)),
+    ]
+
+    # The escaped variants must produce the same cards, so the comparison is like for like
+    for title, summary, image_url, profile_url, platforms in synthetic_rows(50, 50):
+        row = (title, summary, image_url, profile_url)
+        assert mod_card(*row, platforms=platforms) == escaped_fstring_card(*row, platforms=platforms)
+
+    for name, rows in datasets:
+        print(name)
+        for label, card, section in variants:
+            seconds = bench(rows, card, section, args.repeat)
+            print(f"  {label:30s} {seconds * 1e3:8.1f} ms  {seconds / len(rows) * 1e9:6.0f} ns/row")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,23 +1,33 @@
 import sqlite3
 import os
 import json
+import sys
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
-from typing import Optional
+from typing import Iterator, Optional
 
 DB_PATH = os.path.join(os.path.dirname(__file__), "..", "mods.db")
 
+# Console platforms whose modfile_live bumps count as updates, with display names
+PLATFORMS = {"ps5": "PlayStation", "xboxseriesx": "Xbox"}
 
-@dataclass
+
+@dataclass(slots=True)
 class ModUpdate:
     """Represents a single update event for a mod."""
 
-    timestamp: datetime
-    update_type: str  # 'added' or 'updated'
+    epoch: int  # Unix timestamp in seconds
+    update_type: str  # 'added' or 'updated', interned
     version: int
+    platform: Optional[str] = None  # Platform that was updated, None when added
+
+    @property
+    def timestamp(self) -> datetime:
+        """The update time as a UTC datetime."""
+        return datetime.fromtimestamp(self.epoch, timezone.utc)
 
 
-@dataclass
+@dataclass(slots=True)
 class Mod:
     """Represents a mod with its metadata and update history."""
 
@@ -51,20 +61,24 @@ def parse_timestamp(commit_at: Optional[str]) -> datetime:
         return datetime.now(timezone.utc)
 
 
-def get_platform_version(
-    platforms_json: Optional[str], platform_name: str = "ps5"
-) -> int:
-    """Extract the modfile_live version for a specific platform."""
+def parse_epoch(commit_at: Optional[str]) -> int:
+    """Parse ISO timestamp string to Unix seconds."""
+    return int(parse_timestamp(commit_at).timestamp())
+
+
+def get_platform_versions(platforms_json: Optional[str]) -> dict[str, int]:
+    """Extract the modfile_live version of every platform in one parse."""
+    versions: dict[str, int] = {}
     if not platforms_json:
-        return 0
+        return versions
     try:
-        platforms = json.loads(platforms_json)
-        for platform in platforms:
-            if platform.get("platform") == platform_name:
-                return platform.get("modfile_live", 0) or 0
-    except (json.JSONDecodeError, TypeError):
-        return 0
-    return 0
+        for platform in json.loads(platforms_json):
+            name = platform.get("platform")
+            if name not in versions:
+                versions[name] = platform.get("modfile_live", 0) or 0
+    except (json.JSONDecodeError, TypeError, AttributeError):
+        return {}
+    return versions
 
 
 def get_mods(db_path: Optional[str] = None) -> dict[int, Mod]:
@@ -74,107 +88,339 @@ def get_mods(db_path: Optional[str] = None) -> dict[int, Mod]:
     Returns:
         Dictionary mapping item_id to Mod objects with their updates.
     """
+    return {mod.item_id: mod for mod in iter_mods(db_path)}
+
+
+def iter_mods(
+    db_path: Optional[str] = None, use_sql_json: Optional[bool] = None
+) -> Iterator[Mod]:
+    """
+    Stream mods with their update history from the database, one item at a time.
+
+    Reads the mod_events table written at ingest time when it is present,
+    otherwise replays every row of item_version_detail. Rows are walked in
+    item order and each Mod is yielded as soon as its rows run out, so only
+    one item is held in memory at a time.
+
+    Args:
+        db_path: Path to the SQLite database
+        use_sql_json: See iter_mods_from_versions
+
+    Yields:
+        Mod objects in item_id order
+    """
     if db_path is None:
         db_path = DB_PATH
 
     connection = sqlite3.connect(db_path)
-    connection.row_factory = sqlite3.Row
-    cursor = connection.cursor()
+    try:
+        has_events = connection.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'mod_events'"
+        ).fetchone()
+        if has_events:
+            yield from iter_mods_from_events(connection)
+        else:
+            yield from iter_mods_from_versions(connection, use_sql_json)
+    finally:
+        connection.close()
+
+
+def iter_mods_from_events(connection: sqlite3.Connection) -> Iterator[Mod]:
+    """
+    Build mods from the precomputed mod_events table.
+
+    Mod metadata comes from the latest values in the item table, so only one
+    row per event is read instead of every stored version. Items without
+    events, such as those seeded at the platform cutover, are yielded with
+    no updates, so consumers of the whole catalogue still see them.
 
-    # Fetch all versions of all items, ordered by item and version
+    Args:
+        connection: Open database connection
+
+    Yields:
+        Mod objects in item_id order
+    """
     query = """
-    SELECT 
-        _item,
-        _version,
-        _commit_at,
+    SELECT
+        item._id,
+        mod_events.ts,
+        mod_events.kind,
+        mod_events.version,
+        mod_events.platform,
+        item.name,
+        item.summary,
+        item.profile_url,
+        item.logo
+    FROM item
+    LEFT JOIN mod_events ON mod_events.item_id = item._id
+    ORDER BY item._id, mod_events.version, mod_events.rowid
+    """
+    mod: Optional[Mod] = None
+
+    for (
+        item_id,
+        ts,
+        kind,
+        version,
+        platform,
         name,
         summary,
         profile_url,
         logo,
-        platforms
-    FROM item_version_detail
-    ORDER BY _item, _version
+    ) in connection.execute(query):
+        if mod is None or mod.item_id != item_id:
+            if mod is not None:
+                yield mod
+            mod = Mod(
+                item_id=item_id,
+                name=name or f"Mod #{item_id}",
+                summary=summary,
+                profile_url=profile_url,
+                logo_url=parse_logo_url(logo),
+            )
+        if ts is None:
+            continue
+        mod.updates.append(
+            ModUpdate(
+                epoch=parse_epoch(ts),
+                update_type=sys.intern(kind),
+                version=version,
+                platform=platform and sys.intern(platform),
+            )
+        )
+
+    if mod is not None:
+        yield mod
+
+
+VERSIONS_QUERY = """
+SELECT
+    _item,
+    _version,
+    _commit_at,
+    name,
+    summary,
+    profile_url,
+    logo,
+    platforms
+FROM item_version_detail
+ORDER BY _item, _version
+"""
+
+# Same rows as VERSIONS_QUERY, with the logo URL and each tracked platform's
+# modfile_live extracted by SQLite instead of json.loads in Python
+VERSIONS_QUERY_JSON = """
+SELECT
+    _item,
+    _version,
+    _commit_at,
+    name,
+    summary,
+    profile_url,
+    logo IS NOT NULL AND logo != '' AS has_logo,
+    CASE WHEN json_valid(logo) THEN COALESCE(
+        NULLIF(json_extract(logo, '$.thumb_320x180'), ''),
+        json_extract(logo, '$.original')
+    ) END AS logo_url,
+    platforms IS NOT NULL AND platforms != '' AS has_platforms,
+    {platform_columns}
+FROM item_version_detail
+ORDER BY _item, _version
+"""
+
+PLATFORM_COLUMN = """CASE WHEN json_valid(platforms) THEN (
+        SELECT json_extract(value, '$.modfile_live')
+        FROM json_each(platforms)
+        WHERE json_extract(value, '$.platform') = ?
+        LIMIT 1
+    ) END"""
+
+
+def has_sqlite_json(connection: sqlite3.Connection) -> bool:
+    """Check whether SQLite was built with the JSON1 functions."""
+    try:
+        connection.execute("SELECT json_extract('{}', '$')")
+    except sqlite3.OperationalError:
+        return False
+    return True
+
+
+def iter_version_rows(connection: sqlite3.Connection, use_sql_json: bool):
     """
-    cursor.execute(query)
-    rows = cursor.fetchall()
+    Yield one tuple per stored version with the JSON fields already extracted.
 
-    cursor.close()
-    connection.close()
+    Args:
+        connection: Open database connection
+        use_sql_json: Extract in SQLite (True) or with json.loads (False)
 
-    # Build mod dictionary with updates
-    mods: dict[int, Mod] = {}
-    # Track the previous platforms per item for version bump detection
-    previous_platforms: dict[int, str] = {}
+    Yields:
+        (item, version, commit_at, name, summary, profile_url, has_logo,
+        logo_url, has_platforms, modfile_live) tuples, where modfile_live is
+        a tuple with one entry per tracked platform in PLATFORMS order
+    """
+    if use_sql_json:
+        query = VERSIONS_QUERY_JSON.format(
+            platform_columns=",\n    ".join([PLATFORM_COLUMN] * len(PLATFORMS))
+        )
+        for row in connection.execute(query, tuple(PLATFORMS)):
+            yield (
+                *row[:6],
+                bool(row[6]),
+                row[7],
+                bool(row[8]),
+                tuple(live or 0 for live in row[9:]),
+            )
+        return
+
+    for row in connection.execute(VERSIONS_QUERY):
+        logo, platforms = row[6], row[7]
+        versions = get_platform_versions(platforms)
+        yield (
+            *row[:6],
+            bool(logo),
+            parse_logo_url(logo),
+            bool(platforms),
+            tuple(versions.get(name, 0) for name in PLATFORMS),
+        )
+
+
+def iter_mods_from_versions(
+    connection: sqlite3.Connection, use_sql_json: Optional[bool] = None
+) -> Iterator[Mod]:
+    """
+    Build mods by replaying every stored version of every item.
+
+    Args:
+        connection: Open database connection
+        use_sql_json: Extract logo and platform fields in SQLite; defaults
+            to True when SQLite supports JSON1
+
+    Yields:
+        Mod objects in item_id order
+    """
+    if use_sql_json is None:
+        use_sql_json = has_sqlite_json(connection)
 
-    for row in rows:
-        item_id = row["_item"]
-        version = row["_version"]
-        platforms = row["platforms"]
+    # The mod being built and its previous modfile_live per platform
+    mod: Optional[Mod] = None
+    old_versions: dict[str, int] = {}
+
+    # Walk all versions of all items, ordered by item and version,
+    # checking every tracked platform in the same pass
+    for (
+        item_id,
+        version,
+        commit_at,
+        name,
+        summary,
+        profile_url,
+        has_logo,
+        logo_url,
+        has_platforms,
+        new_versions,
+    ) in iter_version_rows(connection, use_sql_json):
+        if mod is not None and mod.item_id != item_id:
+            # No more rows for the previous item
+            yield mod
+            mod = None
 
         if version == 1:
             # First version - this is when the mod was added
             mod = Mod(
                 item_id=item_id,
-                name=row["name"] or f"Mod #{item_id}",
-                summary=row["summary"],
-                profile_url=row["profile_url"],
-                logo_url=parse_logo_url(row["logo"]),
+                name=name or f"Mod #{item_id}",
+                summary=summary,
+                profile_url=profile_url,
+                logo_url=logo_url,
             )
-            mod.updates.append(
-                ModUpdate(
-                    timestamp=parse_timestamp(row["_commit_at"]),
-                    update_type="added",
-                    version=version,
+            # One event per platform it is live on, merged into one card later
+            live = [platform for platform, new_ver in zip(PLATFORMS, new_versions) if new_ver > 0]
+            for platform in live or [None]:
+                mod.updates.append(
+                    ModUpdate(
+                        epoch=parse_epoch(commit_at),
+                        update_type="added",
+                        version=version,
+                        platform=platform,
+                    )
                 )
-            )
-            mods[item_id] = mod
-            previous_platforms[item_id] = platforms
+            old_versions = dict(zip(PLATFORMS, new_versions))
         else:
-            # Subsequent version - check if it's a real update (version bump on ps5)
-            mod = mods.get(item_id)
+            # Subsequent version - check if it's a real update (version bump)
             if mod is None:
                 # Orphan update without a version 1 - create the mod
                 mod = Mod(
                     item_id=item_id,
-                    name=row["name"] or f"Mod #{item_id}",
-                    summary=row["summary"],
-                    profile_url=row["profile_url"],
-                    logo_url=parse_logo_url(row["logo"]),
+                    name=name or f"Mod #{item_id}",
+                    summary=summary,
+                    profile_url=profile_url,
+                    logo_url=logo_url,
                 )
-                mods[item_id] = mod
+                old_versions = {}
 
             # Update mod metadata if we have newer info
-            if row["name"]:
-                mod.name = row["name"]
-            if row["summary"]:
-                mod.summary = row["summary"]
-            if row["profile_url"]:
-                mod.profile_url = row["profile_url"]
-            if row["logo"]:
-                mod.logo_url = parse_logo_url(row["logo"])
-
-            # Check for version bump on ps5 platform
-            old_ver = get_platform_version(previous_platforms.get(item_id), "ps5")
-            new_ver = get_platform_version(platforms, "ps5")
-
-            if new_ver > old_ver:
-                mod.updates.append(
-                    ModUpdate(
-                        timestamp=parse_timestamp(row["_commit_at"]),
-                        update_type="updated",
-                        version=version,
+            if name:
+                mod.name = name
+            if summary:
+                mod.summary = summary
+            if profile_url:
+                mod.profile_url = profile_url
+            if has_logo:
+                mod.logo_url = logo_url
+
+            # Check for a version bump on each platform
+            for platform, new_ver in zip(PLATFORMS, new_versions):
+                if new_ver > old_versions.get(platform, 0):
+                    mod.updates.append(
+                        ModUpdate(
+                            epoch=parse_epoch(commit_at),
+                            update_type="updated",
+                            version=version,
+                            platform=platform,
+                        )
                     )
-                )
 
-            # Update tracked platforms
-            # Update tracked platforms
-            if new_ver > 0:
-                previous_platforms[item_id] = platforms
+                # Update tracked platforms
+                if new_ver > 0:
+                    old_versions[platform] = new_ver
+
+    if mod is not None:
+        yield mod
+
+
+def check_json_extraction(db_path: Optional[str] = None) -> int:
+    """
+    Compare the SQLite and Python JSON extraction paths row by row.
+
+    Args:
+        db_path: Path to the SQLite database
 
-    return mods
+    Returns:
+        Number of rows where the two paths disagree
+    """
+    if db_path is None:
+        db_path = DB_PATH
+
+    connection = sqlite3.connect(db_path)
+    mismatches = 0
+    try:
+        sql_rows = iter_version_rows(connection, use_sql_json=True)
+        python_rows = iter_version_rows(connection, use_sql_json=False)
+        for sql_row, python_row in zip(sql_rows, python_rows, strict=True):
+            if sql_row != python_row:
+                mismatches += 1
+                print(f"Mismatch:\n  sql:    {sql_row}\n  python: {python_row}")
+    finally:
+        connection.close()
+    return mismatches
 
 
 if __name__ == "__main__":
+    if "--check-json" in sys.argv:
+        mismatches = check_json_extraction()
+        print(f"{mismatches} mismatching row(s) between SQL and Python extraction")
+        sys.exit(1 if mismatches else 0)
+
     mods = get_mods()
 
     print(f"Found {len(mods)} mods\n")
@@ -1,21 +1,32 @@
 """HTML/CSS components package for the mod changelog."""
 
 from .styles import get_all_styles
-from .document import html_document
-from .layout import page_layout
-from .date_divider import date_nav, date_section
-from .tabs import mod_card, empty_state, tabs_script
+from .document import html_document, iter_html_document
+from .layout import page_layout, iter_page_layout
+from .date_divider import date_nav, platform_filter, date_section, day_index
+from .tabs import mod_card, mod_ref, mod_templates, empty_state, tabs_script
+from .client_render import client_render_script
+from .search import search_box, search_script
 from .modal import info_button, info_modal, MODAL_SCRIPT
 
 __all__ = [
     "get_all_styles",
     "html_document",
+    "iter_html_document",
     "page_layout",
+    "iter_page_layout",
     "date_nav",
+    "platform_filter",
     "date_section",
+    "day_index",
     "mod_card",
+    "mod_ref",
+    "mod_templates",
     "empty_state",
     "tabs_script",
+    "client_render_script",
+    "search_box",
+    "search_script",
     "info_button",
     "info_modal",
     "MODAL_SCRIPT",
@@ -0,0 +1,91 @@
+"""Client-side rendering of the changelog from the JSON feed."""
+
+import json
+
+from .tabs import FALLBACK_IMAGE, LINK_ICON
+
+
+def client_render_script(feed_url: str = "changelog.json") -> str:
+    """
+    Generate the JavaScript that builds the date sections from the feed.
+
+    The markup matches ``date_section``, ``mod_card`` and ``empty_state``,
+    so the styles and ``tabs_script`` work unchanged; the fallback image
+    and link icon are taken from ``tabs``. Pair it with
+    ``tabs_script(autostart=False)``.
+
+    Args:
+        feed_url: URL of the feed written by ``generate_html``
+
+    Returns:
+        JavaScript code that fetches the feed and renders the changelog
+    """
+    return """
+        <script>
+            const FEED_URL = """ + json.dumps(feed_url) + """;
+            const FALLBACK_IMAGE = """ + json.dumps(FALLBACK_IMAGE) + """;
+            const LINK_ICON = """ + json.dumps(LINK_ICON) + """;
+
+            function escapeHtml(value) {
+                return String(value ?? '').replace(/[&<>"']/g, c => `&#${c.charCodeAt(0)};`);
+            }
+
+            function renderEmptyState(message) {
+                return `<div class="empty-state"><div class="empty-state-icon">📦</div><div class="empty-state-text">${message}</div></div>`;
+            }
+
+            function renderModCard(mod, platforms) {
+                const img = escapeHtml(mod.logo || FALLBACK_IMAGE);
+                const tag = mod.url ? 'a' : 'div';
+                const href = mod.url ? `href="${escapeHtml(mod.url)}" target="_blank" rel="noopener noreferrer"` : '';
+                return `<${tag} class="mod-row" data-platforms="${platforms}" ${href}>
+            <img class="mod-thumb" src="${img}" alt="" loading="lazy" onerror="this.src='${FALLBACK_IMAGE}'">
+            <div class="mod-info">
+                <div class="mod-title">${escapeHtml(mod.name)}</div>
+                <div class="mod-summary">${escapeHtml(mod.summary)}</div>
+            </div>
+            ${mod.url ? LINK_ICON : ''}
+        </${tag}>`;
+            }
+
+            function renderPanel(feed, rows, tabId, active, emptyMessage) {
+                const cards = rows.length
+                    ? rows.map(([id, platforms]) => renderModCard(feed.mods[id], platforms)).join('')
+                    : renderEmptyState(emptyMessage);
+                return `<div class="tab-panel ${active === tabId ? 'active' : ''}" data-panel="${tabId}"><div class="mod-list">${cards}</div></div>`;
+            }
+
+            function renderTabButton(tabId, label, count, active) {
+                return `<button class="tab-button ${active === tabId ? 'active' : ''}" data-tab="${tabId}" onclick="switchTab('${tabId}')"><span>${label}</span><span class="tab-count">${count}</span></button>`;
+            }
+
+            function renderDateSection(feed, day, isFirst) {
+                // Default to the tab that has content (prefer "new" if both have content)
+                const defaultTab = day.new.length > 0 ? 'new' : 'updated';
+                return `<div class="date-section ${isFirst ? 'active' : ''}" data-date="${day.date}" data-new-count="${day.new.length}" data-updated-count="${day.updated.length}" data-default-tab="${defaultTab}">
+            <div class="date-content">
+                <div class="tab-bar"><div class="tab-group">${renderTabButton('new', 'New', day.new.length, defaultTab)}${renderTabButton('updated', 'Updated', day.updated.length, defaultTab)}</div></div>
+                <div class="tab-panels">${renderPanel(feed, day.new, 'new', defaultTab, 'No new mods')}${renderPanel(feed, day.updated, 'updated', defaultTab, 'No updates')}</div>
+            </div>
+        </div>`;
+            }
+
+            document.addEventListener('DOMContentLoaded', function() {
+                const stack = document.querySelector('.changelog-stack');
+                fetch(FEED_URL)
+                    .then(r => {
+                        if (!r.ok) throw new Error(r.status);
+                        return r.json();
+                    })
+                    .then(feed => {
+                        stack.insertAdjacentHTML('beforeend', feed.days.length
+                            ? feed.days.map((day, i) => renderDateSection(feed, day, i === 0)).join('')
+                            : renderEmptyState('No mods found'));
+                        initChangelog();
+                    })
+                    .catch(() => {
+                        stack.insertAdjacentHTML('beforeend', renderEmptyState('Could not load the changelog'));
+                    });
+            });
+        </script>
+    """
@@ -1,5 +1,9 @@
 """Date navigation component."""
 
+import json
+
+from .escape import escape
+
 
 def date_nav() -> str:
     """
@@ -24,6 +28,28 @@ def date_nav() -> str:
         </div>"""
 
 
+def platform_filter(platforms: dict[str, str]) -> str:
+    """
+    Generate the platform filter buttons shown under the date navigation.
+
+    Args:
+        platforms: Mapping of platform id to display name
+
+    Returns:
+        HTML string for the platform filter
+    """
+    buttons = "".join(
+        f"""
+                <button class="platform-button" data-platform="{platform}" onclick="setPlatform('{platform}')">{label}</button>"""
+        for platform, label in platforms.items()
+    )
+    return f"""<div class="platform-filter">
+            <div class="platform-group">
+                <button class="platform-button active" data-platform="all" onclick="setPlatform('all')">All</button>{buttons}
+            </div>
+        </div>"""
+
+
 def date_section(
     date_str: str,
     new_count: int,
@@ -55,7 +81,7 @@ def date_section(
     new_panel_active = "active" if default_tab == "new" else ""
     updated_panel_active = "active" if default_tab == "updated" else ""
 
-    return f"""<div class="date-section {active}" data-date="{date_str}" data-new-count="{new_count}" data-updated-count="{updated_count}" data-default-tab="{default_tab}">
+    return f"""<div class="date-section {active}" data-date="{escape(date_str)}" data-new-count="{new_count}" data-updated-count="{updated_count}" data-default-tab="{default_tab}">
             <div class="date-content">
                 <div class="tab-bar">
                     <div class="tab-group">
@@ -79,3 +105,21 @@ def date_section(
                 </div>
             </div>
         </div>"""
+
+
+def day_index(days: list[str], total_new: int, base_url: str = "days/") -> str:
+    """
+    Generate the index of days that are not in the page but loaded on demand.
+
+    Args:
+        days: ISO dates of the days served as fragments, newest first
+        total_new: Number of new mods across all days, including unloaded ones
+        base_url: URL prefix of the fragments, each named ``<date>.html``
+
+    Returns:
+        HTML string for a JSON script block read by the date navigation
+    """
+    index = json.dumps({"base": base_url, "days": days, "totalNew": total_new})
+    # Keep "</script>" in the data from closing the block
+    index = index.replace("</", "<\\/")
+    return f"""<script type="application/json" id="day-index">{index}</script>"""
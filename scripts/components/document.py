@@ -1,5 +1,7 @@
 """HTML document wrapper component."""
 
+from typing import Iterable, Iterator
+
 from .styles import get_all_styles
 from .modal import info_modal, MODAL_SCRIPT
 
@@ -23,9 +25,13 @@ ANALYTICS_SCRIPT = """<script data-goatcounter="https://penrose.goatcounter.com/
 
 def html_document(title: str, body_content: str) -> str:
     """Generate a complete HTML document."""
+    return "".join(iter_html_document(title, [body_content]))
+
+
+def iter_html_document(title: str, body_chunks: Iterable[str]) -> Iterator[str]:
+    """Generate a complete HTML document piece by piece around streamed body chunks."""
     styles = get_all_styles()
-    modal_html = info_modal()
-    return f"""<!DOCTYPE html>
+    yield f"""<!DOCTYPE html>
 <html lang="en">
 <head>
     <meta charset="UTF-8">
@@ -36,7 +42,10 @@ def html_document(title: str, body_content: str) -> str:
     </style>
 </head>
 <body>
-{body_content}
+"""
+    yield from body_chunks
+    modal_html = info_modal()
+    yield f"""
 {modal_html}
 {MODAL_SCRIPT}
 {COLLAPSIBLE_SCRIPT}
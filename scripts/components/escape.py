@@ -0,0 +1,12 @@
+"""HTML escaping for the text and URLs components put into markup."""
+
+import html
+
+
+def escape(value: str) -> str:
+    """HTML-escape text or a quoted attribute value."""
+    # Most values need no escaping; checking first is cheaper than html.escape's
+    # five replace passes
+    if "&" in value or "<" in value or ">" in value or '"' in value or "'" in value:
+        return html.escape(value)
+    return value
@@ -1,17 +1,29 @@
 """Page layout component."""
 
+from typing import Iterable, Iterator
+
 from .modal import info_button
 
 
 def page_layout(title: str, content: str, hero_image_url: str = None, date_nav_html: str = "") -> str:
     """Generate the page layout with header, navigation, and main content area."""
+    return "".join(iter_page_layout(title, [content], hero_image_url, date_nav_html))
+
+
+def iter_page_layout(
+    title: str,
+    content_chunks: Iterable[str],
+    hero_image_url: str = None,
+    date_nav_html: str = "",
+) -> Iterator[str]:
+    """Generate the page layout piece by piece around streamed content chunks."""
     logo_html = (
         f'<img src="{hero_image_url}" alt="Logo" class="header-logo">'
         if hero_image_url
         else ""
     )
 
-    return f"""    <header class="app-header">
+    yield f"""    <header class="app-header">
         <div class="header-content">
             {logo_html}
             <span class="header-title">{title}</span>
@@ -26,6 +38,8 @@ def page_layout(title: str, content: str, hero_image_url: str = None, date_nav_h
 {date_nav_html}
     <main class="changelog-container">
         <div class="changelog-stack">
-{content}
+"""
+    yield from content_chunks
+    yield """
         </div>
     </main>"""
@@ -0,0 +1,186 @@
+"""Mod search box backed by the prebuilt search index."""
+
+import json
+
+
+def search_box() -> str:
+    """
+    Generate the search box shown under the platform filter.
+
+    Returns:
+        HTML string for the search input and its results list
+    """
+    return """<div class="search">
+            <input class="search-input" type="search" placeholder="Search all mods" aria-label="Search all mods" autocomplete="off" spellcheck="false">
+            <div class="search-results" hidden></div>
+        </div>"""
+
+
+def search_script(index_url: str = "search-index.json") -> str:
+    """
+    Generate the JavaScript that queries the search index.
+
+    The index written by ``build_search_index`` is fetched the first time
+    the search box gets focus. Each query token is prefix-matched against
+    the sorted token list with a binary search and the posting lists are
+    intersected, so no rows are scanned, on the page or in the index.
+
+    Args:
+        index_url: URL of the index written by ``generate_html``
+
+    Returns:
+        JavaScript code for the search box
+    """
+    return """
+        <script>
+            const SEARCH_INDEX_URL = """ + json.dumps(index_url) + """;
+            const SEARCH_LIMIT = 20;
+            let searchIndex = null;
+            let searchIndexRequest = null;
+
+            function loadSearchIndex() {
+                if (!searchIndexRequest) {
+                    searchIndexRequest = fetch(SEARCH_INDEX_URL)
+                        .then(r => {
+                            if (!r.ok) throw new Error(r.status);
+                            return r.json();
+                        })
+                        .then(index => {
+                            searchIndex = index;
+                            return index;
+                        })
+                        .catch(error => {
+                            searchIndexRequest = null;
+                            throw error;
+                        });
+                }
+                return searchIndexRequest;
+            }
+
+            function searchTokens(text) {
+                // Same split as the index: runs of letters and digits
+                return text.toLowerCase().match(/[\\p{L}\\p{N}]+/gu) || [];
+            }
+
+            function lowerBound(tokens, value) {
+                let lo = 0;
+                let hi = tokens.length;
+                while (lo < hi) {
+                    const mid = (lo + hi) >> 1;
+                    if (tokens[mid] < value) lo = mid + 1;
+                    else hi = mid;
+                }
+                return lo;
+            }
+
+            function prefixPositions(index, prefix) {
+                // Tokens starting with the prefix are one contiguous run of the sorted list
+                const start = lowerBound(index.tokens, prefix);
+                const end = lowerBound(index.tokens, prefix + '\\uffff');
+                if (end - start === 1) return index.postings[start];
+                const positions = new Set();
+                for (let i = start; i < end; i++) {
+                    for (const position of index.postings[i]) positions.add(position);
+                }
+                return Array.from(positions).sort((a, b) => a - b);
+            }
+
+            function intersect(a, b) {
+                const result = [];
+                let i = 0;
+                let j = 0;
+                while (i < a.length && j < b.length) {
+                    if (a[i] < b[j]) i++;
+                    else if (a[i] > b[j]) j++;
+                    else {
+                        result.push(a[i]);
+                        i++;
+                        j++;
+                    }
+                }
+                return result;
+            }
+
+            function searchMods(index, query) {
+                // Positions follow the mods' latest events, so matches come out newest first
+                const terms = [...new Set(searchTokens(query))].sort((a, b) => b.length - a.length);
+                if (!terms.length) return [];
+                let matches = prefixPositions(index, terms[0]);
+                for (let i = 1; i < terms.length && matches.length; i++) {
+                    matches = intersect(matches, prefixPositions(index, terms[i]));
+                }
+                return matches;
+            }
+
+            function formatEventDate(isoDate) {
+                const [year, month, day] = isoDate.split('-').map(Number);
+                return new Date(year, month - 1, day).toLocaleDateString('en-US', { month: 'short', day: 'numeric', year: 'numeric' });
+            }
+
+            function renderSearchResults(container, query) {
+                container.replaceChildren();
+                if (!searchIndex || !searchTokens(query).length) {
+                    container.hidden = true;
+                    return;
+                }
+                const matches = searchMods(searchIndex, query);
+                const summary = document.createElement('div');
+                summary.className = 'search-summary';
+                summary.textContent = matches.length > SEARCH_LIMIT
+                    ? `${matches.length} mods, showing the ${SEARCH_LIMIT} most recent`
+                    : matches.length === 1 ? '1 mod' : `${matches.length || 'No'} mods`;
+                container.appendChild(summary);
+                for (const position of matches.slice(0, SEARCH_LIMIT)) {
+                    const [, name, url, lastDate, lastType] = searchIndex.mods[position];
+                    const result = document.createElement(url ? 'a' : 'div');
+                    result.className = 'search-result';
+                    if (url) {
+                        result.href = url;
+                        result.target = '_blank';
+                        result.rel = 'noopener noreferrer';
+                    }
+                    const title = document.createElement('span');
+                    title.className = 'search-result-name';
+                    title.textContent = name;
+                    result.appendChild(title);
+                    if (lastDate) {
+                        const meta = document.createElement('span');
+                        meta.className = 'search-result-meta';
+                        meta.textContent = `${lastType === 'added' ? 'Added' : 'Updated'} ${formatEventDate(lastDate)}`;
+                        result.appendChild(meta);
+                    }
+                    container.appendChild(result);
+                }
+                container.hidden = false;
+            }
+
+            document.addEventListener('DOMContentLoaded', function() {
+                const input = document.querySelector('.search-input');
+                const results = document.querySelector('.search-results');
+                if (!input || !results) return;
+                const update = () => renderSearchResults(results, input.value);
+                input.addEventListener('focus', () => loadSearchIndex().then(update).catch(() => {}));
+                input.addEventListener('input', () => {
+                    if (searchIndex) update();
+                    else loadSearchIndex().then(update).catch(() => {
+                        results.replaceChildren();
+                        const summary = document.createElement('div');
+                        summary.className = 'search-summary';
+                        summary.textContent = 'Could not load the search index';
+                        results.appendChild(summary);
+                        results.hidden = false;
+                    });
+                });
+                input.addEventListener('keydown', event => {
+                    if (event.key === 'Escape') {
+                        input.value = '';
+                        update();
+                        input.blur();
+                    }
+                });
+                document.addEventListener('click', event => {
+                    if (!event.target.closest('.search')) results.hidden = true;
+                });
+            });
+        </script>
+    """
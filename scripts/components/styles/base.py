@@ -293,6 +293,51 @@ STYLES = """
             white-space: nowrap;
         }
 
+        /* Platform Filter */
+        .platform-filter {
+            display: flex;
+            justify-content: center;
+            margin: 0.75rem 0 0 0;
+        }
+
+        .platform-group {
+            display: flex;
+            align-items: center;
+            background: var(--bg-primary);
+            border: 1px solid var(--border-color);
+            border-radius: 9999px;
+            box-shadow: var(--shadow-sm);
+            padding: 0.125rem;
+            gap: 0.125rem;
+        }
+
+        .platform-button {
+            padding: 0.125rem 0.625rem;
+            border: none;
+            background: transparent;
+            border-radius: 9999px;
+            cursor: pointer;
+            font-family: 'Inter', sans-serif;
+            font-size: 0.75rem;
+            font-weight: 500;
+            color: var(--text-secondary);
+            transition: all 0.2s ease;
+        }
+
+        .platform-button:hover {
+            background: var(--bg-tertiary);
+            color: var(--text-primary);
+        }
+
+        .platform-button.active {
+            background: var(--bg-tertiary);
+            color: var(--gold-primary);
+        }
+
+        .mod-row.platform-hidden {
+            display: none;
+        }
+
         /* Date Sections */
         .date-section {
             display: none;
@@ -660,6 +705,84 @@ STYLES = """
             color: var(--text-primary);
         }
 
+        /* Search */
+        .search {
+            position: relative;
+            max-width: 360px;
+            margin: 0.75rem auto 0;
+        }
+
+        .search-input {
+            width: 100%;
+            padding: 0.375rem 0.875rem;
+            border: 1px solid var(--border-color);
+            border-radius: 9999px;
+            background: var(--bg-primary);
+            box-shadow: var(--shadow-sm);
+            font-family: 'Inter', sans-serif;
+            font-size: 0.8125rem;
+            color: var(--text-primary);
+            outline: none;
+            transition: border-color 0.15s ease;
+        }
+
+        .search-input:focus {
+            border-color: var(--gold-primary);
+        }
+
+        .search-results {
+            position: absolute;
+            top: calc(100% + 0.375rem);
+            left: 0;
+            right: 0;
+            z-index: 20;
+            max-height: 60vh;
+            overflow-y: auto;
+            background: var(--bg-primary);
+            border: 1px solid var(--border-color);
+            border-radius: 0.5rem;
+            box-shadow: var(--shadow-sm);
+            text-align: left;
+        }
+
+        .search-summary {
+            padding: 0.5rem 0.75rem;
+            font-size: 0.6875rem;
+            font-weight: 600;
+            text-transform: uppercase;
+            letter-spacing: 0.03em;
+            color: var(--text-secondary);
+            border-bottom: 1px solid var(--border-color);
+        }
+
+        .search-result {
+            display: flex;
+            align-items: baseline;
+            justify-content: space-between;
+            gap: 0.75rem;
+            padding: 0.5rem 0.75rem;
+            text-decoration: none;
+            color: var(--text-primary);
+        }
+
+        .search-result:hover {
+            background: var(--bg-tertiary);
+        }
+
+        .search-result-name {
+            font-size: 0.8125rem;
+            font-weight: 500;
+            overflow: hidden;
+            text-overflow: ellipsis;
+            white-space: nowrap;
+        }
+
+        .search-result-meta {
+            flex-shrink: 0;
+            font-size: 0.75rem;
+            color: var(--text-secondary);
+        }
+
         /* Responsive */
         @media (max-width: 480px) {
             .header-stat {
@@ -2,6 +2,8 @@
 
 from typing import Optional
 
+from .escape import escape
+
 
 def tab_bar(new_count: int, updated_count: int, active_tab: str = "new") -> str:
     """
@@ -34,54 +36,89 @@ def tab_bar(new_count: int, updated_count: int, active_tab: str = "new") -> str:
     """
 
 
+FALLBACK_IMAGE = "https://placehold.co/80x45/e2e8f0/64748b?text=No+Image"
+
+# External link icon, shown on rows that link to the mod page
+LINK_ICON = """<svg class="mod-link-icon" viewBox="0 0 16 16" fill="none" stroke="currentColor" stroke-width="1.5"><path d="M6 10L14 2m0 0h-5m5 0v5M8 4H3a1 1 0 00-1 1v8a1 1 0 001 1h8a1 1 0 001-1V9"/></svg>"""
+
+
 def mod_card(
     title: str,
     summary: str,
     image_url: Optional[str] = None,
     profile_url: Optional[str] = None,
     timestamp: Optional[str] = None,
+    platforms: tuple[str, ...] = (),
 ) -> str:
     """
     Generate a compact mod row.
 
+    Text and URLs are HTML-escaped.
+
     Args:
         title: Mod name
         summary: Mod description
         image_url: URL to the mod's thumbnail
         profile_url: URL to the mod's page
         timestamp: Formatted timestamp string
+        platforms: Platforms this row applies to, used by the platform filter
 
     Returns:
         HTML string for the mod row
     """
-    fallback_image = "https://placehold.co/80x45/e2e8f0/64748b?text=No+Image"
-    img_src = image_url or fallback_image
-
-    # Build as a link if profile_url exists
+    image = escape(image_url) if image_url else FALLBACK_IMAGE
     tag = "a" if profile_url else "div"
+    # Build as a link if profile_url exists
     href = (
-        f'href="{profile_url}" target="_blank" rel="noopener noreferrer"'
+        f'href="{escape(profile_url)}" target="_blank" rel="noopener noreferrer"'
         if profile_url
         else ""
     )
+    link_icon = LINK_ICON if profile_url else ""
 
-    # Link icon (external link)
-    link_icon = (
-        """<svg class="mod-link-icon" viewBox="0 0 16 16" fill="none" stroke="currentColor" stroke-width="1.5"><path d="M6 10L14 2m0 0h-5m5 0v5M8 4H3a1 1 0 00-1 1v8a1 1 0 001 1h8a1 1 0 001-1V9"/></svg>"""
-        if profile_url
-        else ""
-    )
-
-    return f"""<{tag} class="mod-row" {href}>
-            <img class="mod-thumb" src="{img_src}" alt="" loading="lazy" onerror="this.src='{fallback_image}'">
+    return f"""<{tag} class="mod-row" data-platforms="{" ".join(platforms)}" {href}>
+            <img class="mod-thumb" src="{image}" alt="" loading="lazy" onerror="this.src='{FALLBACK_IMAGE}'">
             <div class="mod-info">
-                <div class="mod-title">{title}</div>
-                <div class="mod-summary">{summary}</div>
+                <div class="mod-title">{escape(title)}</div>
+                <div class="mod-summary">{escape(summary)}</div>
             </div>
             {link_icon}
         </{tag}>"""
 
 
+def mod_ref(item_id: int, platforms: tuple[str, ...] = ()) -> str:
+    """
+    Generate a placeholder row that is replaced by the mod's card template.
+
+    The placeholder carries the row's platforms, so the platform filter
+    can count it before ``tabs_script`` swaps in the card.
+
+    Args:
+        item_id: ID of the mod whose ``mod_template`` fills the row
+        platforms: Platforms this row applies to, used by the platform filter
+
+    Returns:
+        HTML string for the placeholder row
+    """
+    return f'<div class="mod-row mod-ref" data-mod="{item_id}" data-platforms="{" ".join(platforms)}"></div>'
+
+
+def mod_templates(cards: dict[int, str]) -> str:
+    """
+    Generate the hidden card templates that ``mod_ref`` rows point to.
+
+    Args:
+        cards: Mapping of mod ID to its card HTML, without platforms
+
+    Returns:
+        HTML string with one <template> per mod
+    """
+    templates = "".join(
+        f'<template id="mod-{item_id}">{card}</template>' for item_id, card in cards.items()
+    )
+    return f'<div id="mod-templates" hidden>{templates}</div>'
+
+
 def tab_panel(tab_id: str, content: str, is_active: bool = False) -> str:
     """
     Generate a tab panel container.
@@ -121,17 +158,84 @@ def empty_state(message: str = "No mods to display") -> str:
     """
 
 
-def tabs_script() -> str:
+def tabs_script(autostart: bool = True) -> str:
     """
     Generate the JavaScript for tab and date switching.
 
+    Args:
+        autostart: Initialize on DOMContentLoaded; when False the page
+            calls ``initChangelog()`` once its date sections exist
+
     Returns:
         JavaScript code for the tab and date navigation functionality
     """
+    start = (
+        "document.addEventListener('DOMContentLoaded', initChangelog);"
+        if autostart
+        else ""
+    )
     return """
         <script>
             let currentDateIndex = 0;
             let currentTab = 'new';
+            let currentPlatform = 'all';
+            
+            // Older days not in the page, loaded one at a time by prevDate
+            const dayIndexEl = document.getElementById('day-index');
+            const dayIndex = dayIndexEl ? JSON.parse(dayIndexEl.textContent) : { base: '', days: [] };
+            let nextDay = 0;
+            let loadingDay = false;
+            
+            function hasOlderDays() {
+                return nextDay < dayIndex.days.length;
+            }
+            
+            function getTabCount(section, tabId) {
+                // Counts after the platform filter, falling back to the totals
+                const visible = tabId === 'new' ? section.dataset.visibleNew : section.dataset.visibleUpdated;
+                if (visible !== undefined) return parseInt(visible) || 0;
+                return parseInt(tabId === 'new' ? section.dataset.newCount : section.dataset.updatedCount) || 0;
+            }
+            
+            function setPlatform(platform) {
+                currentPlatform = platform;
+                
+                document.querySelectorAll('.platform-button').forEach(btn => {
+                    btn.classList.toggle('active', btn.dataset.platform === platform);
+                });
+                
+                // Hide rows for other platforms and recount every section
+                document.querySelectorAll('.date-section').forEach(applyPlatform);
+                
+                localStorage.setItem('activePlatform', platform);
+                updateDateDisplay();
+            }
+            
+            function hydrateSection(section) {
+                // Swap placeholder rows for a copy of their mod's card template
+                section.querySelectorAll('.mod-ref').forEach(ref => {
+                    const template = document.getElementById(`mod-${ref.dataset.mod}`);
+                    if (!template) return;
+                    const row = template.content.firstElementChild.cloneNode(true);
+                    row.dataset.platforms = ref.dataset.platforms;
+                    row.classList.toggle('platform-hidden', ref.classList.contains('platform-hidden'));
+                    ref.replaceWith(row);
+                });
+            }
+            
+            function applyPlatform(section) {
+                ['new', 'updated'].forEach(tabId => {
+                    let visible = 0;
+                    section.querySelectorAll(`.tab-panel[data-panel="${tabId}"] .mod-row`).forEach(row => {
+                        const show = currentPlatform === 'all' || row.dataset.platforms.split(' ').includes(currentPlatform);
+                        row.classList.toggle('platform-hidden', !show);
+                        if (show) visible++;
+                    });
+                    section.dataset[tabId === 'new' ? 'visibleNew' : 'visibleUpdated'] = visible;
+                    const count = section.querySelector(`.tab-button[data-tab="${tabId}"] .tab-count`);
+                    if (count) count.textContent = visible;
+                });
+            }
             
             function switchTab(tabId) {
                 const activeSection = document.querySelector('.date-section.active');
@@ -191,8 +295,9 @@ def tabs_script() -> str:
                 
                 // Update label - show "Start Tracking" for the oldest entry
                 const activeSection = sections[currentDateIndex];
+                if (activeSection) hydrateSection(activeSection);
                 if (currentLabel && activeSection) {
-                    const isFirstEntry = currentDateIndex === sections.length - 1;
+                    const isFirstEntry = currentDateIndex === sections.length - 1 && !hasOlderDays();
                     const isMostRecent = currentDateIndex === 0;
                     
                     currentLabel.textContent = isFirstEntry ? 'Started Tracking' : activeSection.dataset.date;
@@ -210,13 +315,13 @@ def tabs_script() -> str:
                 }
                 
                 // Update button states (prev=older, next=newer)
-                if (prevBtn) prevBtn.disabled = currentDateIndex === sections.length - 1;
+                if (prevBtn) prevBtn.disabled = loadingDay || (currentDateIndex === sections.length - 1 && !hasOlderDays());
                 if (nextBtn) nextBtn.disabled = currentDateIndex === 0;
                 
                 // Disable empty tabs
                 if (activeSection) {
-                    const newCount = parseInt(activeSection.dataset.newCount) || 0;
-                    const updatedCount = parseInt(activeSection.dataset.updatedCount) || 0;
+                    const newCount = getTabCount(activeSection, 'new');
+                    const updatedCount = getTabCount(activeSection, 'updated');
                     const newBtn = activeSection.querySelector('.tab-button[data-tab="new"]');
                     const updatedBtn = activeSection.querySelector('.tab-button[data-tab="updated"]');
                     if (newBtn) {
@@ -229,8 +334,8 @@ def tabs_script() -> str:
                 
                 // Use section's default tab if current tab is empty for this section
                 if (activeSection) {
-                    const newCount = parseInt(activeSection.dataset.newCount) || 0;
-                    const updatedCount = parseInt(activeSection.dataset.updatedCount) || 0;
+                    const newCount = getTabCount(activeSection, 'new');
+                    const updatedCount = getTabCount(activeSection, 'updated');
                     let tabToShow = currentTab;
                     if (currentTab === 'new' && newCount === 0) {
                         tabToShow = 'updated';
@@ -248,9 +353,36 @@ def tabs_script() -> str:
                 if (currentDateIndex < sections.length - 1) {
                     currentDateIndex++;
                     updateDateDisplay();
+                } else if (hasOlderDays() && !loadingDay) {
+                    loadOlderDay(sections[sections.length - 1]);
                 }
             }
             
+            function loadOlderDay(lastSection) {
+                // Fetch the next older day's fragment and append it after the last section
+                loadingDay = true;
+                updateDateDisplay();
+                fetch(dayIndex.base + dayIndex.days[nextDay] + '.html')
+                    .then(r => {
+                        if (!r.ok) throw new Error(r.status);
+                        return r.text();
+                    })
+                    .then(html => {
+                        lastSection.insertAdjacentHTML('afterend', html);
+                        const sections = document.querySelectorAll('.date-section');
+                        applyPlatform(sections[sections.length - 1]);
+                        nextDay++;
+                        currentDateIndex = sections.length - 1;
+                    })
+                    .catch(() => {
+                        showToast('Could not load older changes');
+                    })
+                    .finally(() => {
+                        loadingDay = false;
+                        updateDateDisplay();
+                    });
+            }
+            
             function nextDate() {
                 if (currentDateIndex > 0) {
                     currentDateIndex--;
@@ -299,26 +431,35 @@ def tabs_script() -> str:
                     });
             }
             
-            // Initialize on load
-            document.addEventListener('DOMContentLoaded', function() {
+            // Initialize once the date sections are in the page
+            function initChangelog() {
                 const savedTab = localStorage.getItem('activeTab');
                 if (savedTab && ['new', 'updated'].includes(savedTab)) {
                     currentTab = savedTab;
                 }
                 
-                // Calculate total mods
+                // Calculate total mods, including days that are not loaded yet
                 const sections = document.querySelectorAll('.date-section');
                 let totalMods = 0;
                 sections.forEach(section => {
                     totalMods += parseInt(section.dataset.newCount) || 0;
                 });
+                if (dayIndex.totalNew !== undefined) {
+                    totalMods = dayIndex.totalNew;
+                }
                 const totalModsEl = document.getElementById('total-mods');
                 if (totalModsEl) {
                     totalModsEl.textContent = totalMods.toLocaleString();
                 }
                 
-                updateDateDisplay();
+                const savedPlatform = localStorage.getItem('activePlatform');
+                if (savedPlatform && document.querySelector(`.platform-button[data-platform="${savedPlatform}"]`)) {
+                    setPlatform(savedPlatform);
+                } else {
+                    updateDateDisplay();
+                }
                 fetchLastChecked();
-            });
+            }
+            """ + start + """
         </script>
     """
@@ -0,0 +1,171 @@
+"""Convert the data.json history into the sharded per-mod store layout."""
+
+import argparse
+import json
+import subprocess
+from typing import Optional
+
+from .ingest import _git, blob_ids, dedupe_items, read_blobs
+from .scrape import (
+    ID_FIELD,
+    STORE_MANIFEST,
+    manifest_text,
+    record_digest,
+    record_line,
+    shard_path,
+)
+
+
+def _tree_entries(tree: bytes) -> dict[bytes, tuple[bytes, str]]:
+    """Parse a raw tree object into {name: (mode, SHA)}."""
+    entries = {}
+    position = 0
+    while position < len(tree):
+        space = tree.index(b" ", position)
+        nul = tree.index(b"\0", space)
+        sha = tree[nul + 1 : nul + 21].hex()
+        entries[tree[space + 1 : nul]] = (tree[position:space], sha)
+        position = nul + 21
+    return entries
+
+
+def _commit_fields(commit: bytes) -> tuple[bytes, bytes, bytes]:
+    """Split a raw commit object into (author, committer, message)."""
+    headers, _, message = commit.partition(b"\n\n")
+    fields = {}
+    for line in headers.split(b"\n"):
+        key, _, value = line.partition(b" ")
+        fields.setdefault(key, value)
+    return fields[b"author"], fields[b"committer"], message
+
+
+def _data(content: bytes) -> bytes:
+    return b"data %d\n%s\n" % (len(content), content)
+
+
+def convert_history(
+    repo_path: str = ".",
+    data_path: str = "data.json",
+    store_path: str = "data",
+    branch: str = "sharded",
+    rev: str = "HEAD",
+) -> int:
+    """
+    Rewrite the history of rev onto branch with data.json replaced by a store.
+
+    Every first-parent commit of rev is copied with its author, committer
+    and message, and with the rest of its tree untouched. Its data.json is
+    replaced by a store directory (see ``scrape.write_store``) holding the
+    same mods. Each copied commit only adds blobs for the mods that changed,
+    plus the manifest. Duplicate IDs are resolved like the ingester's
+    "dedupe" mode. The commits are written with ``git fast-import``, and an
+    existing branch of the same name is overwritten.
+
+    Args:
+        repo_path: Path to the git repository
+        data_path: Path of the JSON file inside the repository (top level)
+        store_path: Directory to write the store to (top level)
+        branch: Branch that receives the converted history
+        rev: Revision whose history is converted
+
+    Returns:
+        Number of commits written
+    """
+    log = _git(repo_path, "log", "--reverse", "--first-parent", "--format=%H %T", rev)
+    commits = [line.split() for line in log.splitlines() if line]
+    blobs = blob_ids(repo_path, [commit for commit, _ in commits], data_path)
+
+    # Read each commit and its root tree, plus the snapshot whenever it changed
+    objects: list[str] = []
+    last_blob: Optional[str] = None
+    for (commit, tree), blob in zip(commits, blobs):
+        objects += [commit, tree]
+        if blob is not None and blob != last_blob:
+            objects.append(blob)
+        last_blob = blob
+    contents = read_blobs(repo_path, objects)
+
+    process = subprocess.Popen(
+        ["git", "fast-import", "--quiet", "--force"],
+        cwd=repo_path,
+        stdin=subprocess.PIPE,
+    )
+    out = process.stdin
+    out.write(b"reset refs/heads/%s\n" % branch.encode())
+
+    skipped = {data_path.encode(), store_path.encode()}
+    previous_entries: dict[bytes, tuple[bytes, str]] = {}
+    previous_items: dict[int, dict] = {}
+    previous_lines: dict[int, str] = {}
+    last_blob = None
+    for mark, ((commit, _), blob) in enumerate(zip(commits, blobs), 1):
+        author, committer, message = _commit_fields(next(contents))
+        entries = {
+            name: entry
+            for name, entry in _tree_entries(next(contents)).items()
+            if name not in skipped
+        }
+        out.write(b"commit refs/heads/%s\nmark :%d\n" % (branch.encode(), mark))
+        out.write(b"author %s\ncommitter %s\n" % (author, committer))
+        out.write(_data(message))
+
+        for name in previous_entries.keys() - entries.keys():
+            out.write(b"D %s\n" % name)
+        for name, (mode, sha) in entries.items():
+            if previous_entries.get(name) != (mode, sha):
+                out.write(b"M %s %s %s\n" % (mode.rjust(6, b"0"), sha.encode(), name))
+        previous_entries = entries
+
+        if blob is None:
+            if previous_lines:
+                out.write(b"D %s\n" % store_path.encode())
+                previous_items, previous_lines = {}, {}
+        elif blob != last_blob:
+            records, _ = dedupe_items(json.loads(next(contents)))
+            items = {item[ID_FIELD]: item for item in records}
+            lines = {
+                # Only serialize records that differ from the previous snapshot
+                mod_id: previous_lines[mod_id]
+                if previous_items.get(mod_id) == item
+                else record_line(item)
+                for mod_id, item in items.items()
+            }
+            for mod_id in previous_lines.keys() - lines.keys():
+                out.write(b"D %s\n" % f"{store_path}/{shard_path(mod_id)}".encode())
+            for mod_id, line in lines.items():
+                if previous_lines.get(mod_id) != line:
+                    path = f"{store_path}/{shard_path(mod_id)}".encode()
+                    out.write(b"M 100644 inline %s\n" % path)
+                    out.write(_data((line + "\n").encode("utf-8")))
+            manifest = {
+                str(mod_id): record_digest(lines[mod_id]) for mod_id in sorted(lines)
+            }
+            path = f"{store_path}/{STORE_MANIFEST}".encode()
+            out.write(b"M 100644 inline %s\n" % path)
+            out.write(_data(manifest_text(manifest).encode("utf-8")))
+            previous_items, previous_lines = items, lines
+        last_blob = blob
+        out.write(b"\n")
+
+    out.close()
+    contents.close()
+    if process.wait() != 0:
+        raise RuntimeError("git fast-import failed")
+    return len(commits)
+
+
+def main(argv: Optional[list[str]] = None):
+    """CLI entry point."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--data", default="data.json", help="JSON file to convert")
+    parser.add_argument("--store", default="data", help="store directory to create")
+    parser.add_argument("--branch", default="sharded", help="branch to write")
+    parser.add_argument("--rev", default="HEAD", help="history to convert")
+    args = parser.parse_args(argv)
+
+    count = convert_history(".", args.data, args.store, args.branch, args.rev)
+    print(f"Converted {count} commit(s) of {args.data} into {args.store}/ on {args.branch}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,18 +1,132 @@
 """Generate HTML for mod changelog display."""
 
+import argparse
+import glob
+import gzip
+import hashlib
+import itertools
+import json
+import os
+import sqlite3
+import zlib
 from datetime import datetime, date, timezone
 from collections import defaultdict
+from typing import BinaryIO, Callable, Iterable, Iterator, Optional, Union
 
 from .components import (
-    html_document,
-    page_layout,
+    iter_html_document,
+    iter_page_layout,
     date_nav,
+    platform_filter,
     date_section,
+    day_index,
     mod_card,
+    mod_ref,
+    mod_templates,
     empty_state,
     tabs_script,
+    client_render_script,
+    search_box,
+    search_script,
 )
-from .changelog_data import get_mods, Mod, ModUpdate
+from .changelog_data import iter_mods, Mod, ModUpdate, PLATFORMS
+from .search_index import SearchIndexBuilder
+
+try:
+    import brotli
+except ImportError:  # Optional: only gzip copies are written without it
+    brotli = None
+
+
+# Hashes of the generated files, next to the page; see SiteWriter
+SITE_MANIFEST = "site-manifest.json"
+
+# Read size when hashing and compressing generated files
+BLOCK_SIZE = 64 * 1024
+
+RENDER_CACHE_SCHEMA = """
+CREATE TABLE IF NOT EXISTS render_cache (
+    day TEXT PRIMARY KEY,
+    digest TEXT NOT NULL,
+    html TEXT NOT NULL
+);
+"""
+
+
+def renderer_fingerprint() -> str:
+    """Hash of the rendering code, so cached sections expire when templates change."""
+    package = os.path.dirname(os.path.abspath(__file__))
+    paths = [os.path.abspath(__file__)]
+    for root, _, files in os.walk(os.path.join(package, "components")):
+        paths += [os.path.join(root, name) for name in files if name.endswith(".py")]
+    digest = hashlib.sha1()
+    for path in sorted(paths):
+        with open(path, "rb") as f:
+            digest.update(f.read())
+    return digest.hexdigest()
+
+
+class RenderCache:
+    """
+    Rendered date sections kept in the database between runs.
+
+    Each day's HTML is stored with a hash of everything it was rendered
+    from plus the rendering code, and is reused while that hash is unchanged.
+    """
+
+    def __init__(self, db_path: str):
+        self.connection = sqlite3.connect(db_path)
+        self.connection.executescript(RENDER_CACHE_SCHEMA)
+        # Only the digests are loaded; the HTML is read per day on a hit
+        self.digests = dict(self.connection.execute("SELECT day, digest FROM render_cache"))
+        self.fingerprint = renderer_fingerprint()
+        self.seen: set[str] = set()
+        self.hits = 0
+        self.misses = 0
+
+    def section(self, day: str, inputs: tuple, render: Callable[[], str]) -> str:
+        """
+        Return the cached HTML for day if its inputs are unchanged, else render it.
+
+        Args:
+            day: Cache key, the ISO date of the section
+            inputs: Everything the section is rendered from
+            render: Renders the section when the cache misses
+
+        Returns:
+            HTML string for the section
+        """
+        digest = hashlib.sha1(f"{self.fingerprint}{inputs!r}".encode()).hexdigest()
+        self.seen.add(day)
+        if self.digests.get(day) == digest:
+            row = self.connection.execute(
+                "SELECT html FROM render_cache WHERE day = ?", (day,)
+            ).fetchone()
+            if row is not None:
+                self.hits += 1
+                return row[0]
+        self.misses += 1
+        html = render()
+        # Stored right away so re-rendered sections are not all kept until save()
+        self.connection.execute(
+            "INSERT OR REPLACE INTO render_cache (day, digest, html) VALUES (?, ?, ?)",
+            (day, digest, html),
+        )
+        self.digests[day] = digest
+        return html
+
+    def keep(self, day: str) -> None:
+        """Keep day's entry although it was not looked up this run."""
+        self.seen.add(day)
+
+    def save(self) -> None:
+        """Commit re-rendered sections, drop days no longer shown and close."""
+        self.connection.executemany(
+            "DELETE FROM render_cache WHERE day = ?",
+            [(day,) for day in self.digests.keys() - self.seen],
+        )
+        self.connection.commit()
+        self.connection.close()
 
 
 def format_date_delta(dt: datetime) -> str:
@@ -44,49 +158,141 @@ def format_timestamp(dt: datetime) -> str:
     return dt.strftime("%b %d, %Y")
 
 
-def flatten_updates(mods: dict[str, Mod]) -> list[tuple[Mod, ModUpdate]]:
+def flatten_updates(mods: Iterable[Mod]) -> list[tuple[Mod, ModUpdate]]:
     """Flatten mods and their updates into a list of (mod, update) tuples."""
     result = []
-    for mod in mods.values():
+    for mod in mods:
         for update in mod.updates:
             result.append((mod, update))
     return result
 
 
-def generate_mod_cards(updates: list[tuple[Mod, ModUpdate]]) -> str:
-    """Generate mod cards for a list of updates."""
+def update_platforms(
+    updates: list[tuple[Mod, ModUpdate]],
+) -> list[tuple[Mod, ModUpdate, tuple[str, ...]]]:
+    """
+    Merge per-platform events from the same commit into one entry.
+
+    A mod added or updated on several platforms at once produces one event
+    per platform; they are shown as a single card tagged with every
+    platform. Events without a platform add no tag.
+
+    Returns:
+        List of (mod, first update, platforms) tuples in input order
+    """
+    merged: dict[tuple[int, int, str], tuple[Mod, ModUpdate, list[str]]] = {}
+    for mod, update in updates:
+        key = (mod.item_id, update.epoch, update.update_type)
+        entry = merged.get(key)
+        if entry is None:
+            entry = merged[key] = (mod, update, [])
+        if update.platform is not None and update.platform not in entry[2]:
+            entry[2].append(update.platform)
+    return [(mod, update, tuple(platforms)) for mod, update, platforms in merged.values()]
+
+
+class CardRefs:
+    """
+    Mod cards emitted once as templates and referenced from the day panels.
+
+    A mod that changes on many days gets its full card once; each day only
+    carries a small placeholder row that the page fills in on navigation.
+    """
+
+    def __init__(self):
+        self.cards: dict[int, str] = {}
+        self.rows = 0
+        self.full_bytes = 0  # What the rows would take as full cards
+        self.ref_bytes = 0
+
+    def ref(self, mod: Mod, platforms: tuple[str, ...]) -> str:
+        """Placeholder row for mod, recording its card for ``templates``."""
+        card = self.cards.get(mod.item_id)
+        if card is None:
+            card = self.cards[mod.item_id] = mod_card(
+                title=mod.name,
+                summary=mod.summary or "",
+                image_url=mod.logo_url,
+                profile_url=mod.profile_url,
+            )
+        html = mod_ref(mod.item_id, platforms)
+        self.rows += 1
+        # A full row is the card with its platforms filled in
+        self.full_bytes += len(card.encode("utf-8")) + len(" ".join(platforms))
+        self.ref_bytes += len(html)
+        return html
+
+    def templates(self) -> str:
+        """The card templates for every mod referenced so far."""
+        html = mod_templates(self.cards)
+        self.ref_bytes += len(html.encode("utf-8"))
+        return html
+
+    @property
+    def saved_bytes(self) -> int:
+        return self.full_bytes - self.ref_bytes
+
+
+def generate_mod_cards(
+    updates: list[tuple[Mod, ModUpdate, tuple[str, ...]]],
+    refs: Optional[CardRefs] = None,
+) -> str:
+    """
+    Generate mod cards for a list of updates.
+
+    Args:
+        updates: (mod, update, platforms) entries
+        refs: Emit placeholder rows pointing at shared card templates
+            instead of full cards, if given
+    """
     if not updates:
         return empty_state("No mods in this category")
 
     cards = []
-    for mod, update in updates:
+    for mod, update, platforms in updates:
+        if refs is not None:
+            cards.append(refs.ref(mod, platforms))
+            continue
         cards.append(
             mod_card(
                 title=mod.name,
                 summary=mod.summary or "",
                 image_url=mod.logo_url,
                 profile_url=mod.profile_url,
+                platforms=platforms,
             )
         )
 
     return "\n".join(cards)
 
 
-def generate_changelog_content(mods: dict[str, Mod]) -> str:
-    """Generate the HTML content from the mod data."""
-    if not mods:
-        return "<p>No mods found.</p>"
+def card_inputs(entry: tuple[Mod, ModUpdate, tuple[str, ...]]) -> tuple:
+    """Values a mod card is rendered from, for the render cache key."""
+    mod, _, platforms = entry
+    return (mod.name, mod.summary, mod.logo_url, mod.profile_url, platforms)
+
+
+DayUpdates = list[tuple[Mod, ModUpdate, tuple[str, ...]]]
 
+
+def group_by_day(mods: Iterable[Mod]) -> list[tuple[date, DayUpdates, DayUpdates]]:
+    """
+    Group updates into days, newest first, skipping days before tracking started.
+
+    Mods are consumed in one pass, so a stream from ``iter_mods`` works;
+    only mods with updates since tracking started are kept.
+
+    Returns:
+        List of (day, added entries, updated entries) tuples, with entries
+        merged across platforms by ``update_platforms``
+    """
     # Cutoff date: Before December 1st, 2025 is "Started Tracking" (excluded)
     tracking_cutoff = date(2025, 11, 30)
 
-    # Flatten to (mod, update) pairs
-    updates = flatten_updates(mods)
-
     # Group all updates by date first
     by_date: dict[date, dict[str, list[tuple[Mod, ModUpdate]]]] = {}
 
-    for mod, update in updates:
+    for mod, update in flatten_updates(mods):
         update_date = update.timestamp.date()
         # Skip historical data before tracking started
         if update_date <= tracking_cutoff:
@@ -100,81 +306,535 @@ def generate_changelog_content(mods: dict[str, Mod]) -> str:
         else:
             by_date[update_date]["updated"].append((mod, update))
 
-    if not by_date:
-        return empty_state("No mods found"), ""
+    return [
+        (
+            day,
+            update_platforms(by_date[day]["added"]),
+            update_platforms(by_date[day]["updated"]),
+        )
+        for day in sorted(by_date, reverse=True)
+    ]
+
+
+def changelog_feed(days: list[tuple[date, DayUpdates, DayUpdates]]) -> dict:
+    """
+    Build the data the page renders from in client-side mode.
+
+    Each mod's card fields are stored once under its ID, and days only
+    list ``[id, platforms]`` rows, so a mod updated on many days is not
+    repeated.
 
-    # Sort dates descending
-    sorted_dates = sorted(by_date.keys(), reverse=True)
+    Args:
+        days: Output of ``group_by_day``
 
-    # Generate content
-    entries = []
+    Returns:
+        Dict with "days" (newest first) and "mods" keyed by item ID
+    """
+    feed_mods: dict[str, dict] = {}
+    feed_days = []
+    for day, new_mods, updated_mods in days:
+        rows = {}
+        for kind, entries in (("new", new_mods), ("updated", updated_mods)):
+            rows[kind] = []
+            for mod, _, platforms in entries:
+                if str(mod.item_id) not in feed_mods:
+                    feed_mods[str(mod.item_id)] = {
+                        "name": mod.name,
+                        "summary": mod.summary or "",
+                        "logo": mod.logo_url,
+                        "url": mod.profile_url,
+                    }
+                rows[kind].append([mod.item_id, " ".join(platforms)])
+        feed_days.append({"date": day.strftime("%B %d, %Y"), **rows})
+    return {"days": feed_days, "mods": feed_mods}
+
+
+def render_day_section(
+    i: int,
+    day: date,
+    new_mods: DayUpdates,
+    updated_mods: DayUpdates,
+    cache: Optional[RenderCache] = None,
+    refs: Optional[CardRefs] = None,
+) -> str:
+    """
+    Render one day's date section, through the render cache if given.
 
-    # Date sections (date nav is handled separately)
-    for i, day in enumerate(sorted_dates):
-        day_data = by_date[day]
-        formatted_date = day.strftime("%B %d, %Y")
+    Args:
+        i: Position of the day, newest first; the first section starts active
+        day: The day
+        new_mods: Added entries for the day
+        updated_mods: Updated entries for the day
+        cache: Reuses the section if its inputs did not change, if given
+        refs: Render rows as references to shared card templates; such
+            sections are cheap to build and bypass the cache
 
-        new_mods = day_data["added"]
-        updated_mods = day_data["updated"]
+    Returns:
+        HTML string for the date section
+    """
+    formatted_date = day.strftime("%B %d, %Y")
 
+    def render() -> str:
         new_content = (
-            generate_mod_cards(new_mods) if new_mods else empty_state("No new mods")
+            generate_mod_cards(new_mods, refs) if new_mods else empty_state("No new mods")
         )
         updated_content = (
-            generate_mod_cards(updated_mods)
+            generate_mod_cards(updated_mods, refs)
             if updated_mods
             else empty_state("No updates")
         )
-
-        entries.append(
-            date_section(
-                date_str=formatted_date,
-                new_count=len(new_mods),
-                updated_count=len(updated_mods),
-                content_new=new_content,
-                content_updated=updated_content,
-                is_first=(i == 0),
-            )
+        return date_section(
+            date_str=formatted_date,
+            new_count=len(new_mods),
+            updated_count=len(updated_mods),
+            content_new=new_content,
+            content_updated=updated_content,
+            is_first=(i == 0),
         )
 
-    # Add the script
-    entries.append(tabs_script())
+    if refs is not None and cache is not None:
+        cache.keep(day.isoformat())
+    if cache is None or refs is not None:
+        return render()
+    # Only what the cards show goes into the cache key
+    inputs = (
+        formatted_date,
+        i == 0,
+        [card_inputs(entry) for entry in new_mods],
+        [card_inputs(entry) for entry in updated_mods],
+    )
+    return cache.section(day.isoformat(), inputs, render)
 
-    return "\n".join(entries), date_nav()
+
+def iter_changelog_content(
+    mods: Iterable[Mod],
+    cache: Optional[RenderCache] = None,
+    inline_days: Optional[int] = None,
+    days_url: str = "days/",
+    refs: Optional[CardRefs] = None,
+) -> tuple[Iterator[str], str, Iterator[tuple[str, str]]]:
+    """
+    Generate the content from the mod data lazily, one date section at a time.
+
+    Sections are rendered as the returned iterators are consumed, so the
+    caller can write each one out before the next is rendered.
+
+    Args:
+        mods: Mods with their updates, consumed in one pass
+        cache: Reuses date sections whose inputs did not change, if given
+        inline_days: Only include the latest N days in the content; older
+            days are produced separately to be served as fragments
+        days_url: URL prefix the page loads day fragments from
+        refs: Render the page's rows as references to card templates, which
+            follow the sections; day fragments keep full cards so they
+            stand alone
+
+    Returns:
+        Tuple of (content HTML chunks, navigation HTML, (ISO date, section
+        HTML) pairs for the days left out of the content)
+    """
+    mods = iter(mods)
+    first = next(mods, None)
+    if first is None:
+        return iter(["<p>No mods found.</p>"]), "", iter([])
+
+    days = group_by_day(itertools.chain([first], mods))
+    if not days:
+        return iter([empty_state("No mods found")]), "", iter([])
+
+    shown = days if inline_days is None else days[:inline_days]
+    older = [] if inline_days is None else days[inline_days:]
+
+    def content() -> Iterator[str]:
+        # Date sections (date nav is handled separately)
+        for i, (day, new_mods, updated_mods) in enumerate(shown):
+            if i:
+                yield "\n"
+            yield render_day_section(i, day, new_mods, updated_mods, cache, refs)
+        if refs is not None:
+            yield "\n"
+            yield refs.templates()
+        if inline_days is not None:
+            total_new = sum(len(new_mods) for _, new_mods, _ in days)
+            older_days = [day.isoformat() for day, _, _ in older]
+            yield "\n"
+            yield day_index(older_days, total_new, days_url)
+
+        # Add the script
+        yield "\n"
+        yield tabs_script()
+
+    def older_sections() -> Iterator[tuple[str, str]]:
+        for i, (day, new_mods, updated_mods) in enumerate(older, len(shown)):
+            yield day.isoformat(), render_day_section(i, day, new_mods, updated_mods, cache)
+
+    return content(), date_nav() + platform_filter(PLATFORMS), older_sections()
+
+
+def generate_client_content(
+    mods: Iterable[Mod], feed_url: str = "changelog.json"
+) -> tuple[str, str, dict]:
+    """
+    Generate the page content for client-side rendering from the feed.
+
+    Args:
+        mods: Mods with their updates, consumed in one pass
+        feed_url: URL the page fetches the feed from
+
+    Returns:
+        Tuple of (content HTML, navigation HTML, feed data)
+    """
+    feed = changelog_feed(group_by_day(mods))
+    content = client_render_script(feed_url) + tabs_script(autostart=False)
+    return content, date_nav() + platform_filter(PLATFORMS), feed
+
+
+def _read_blocks(f: BinaryIO) -> Iterator[bytes]:
+    """Read a file object in BLOCK_SIZE blocks."""
+    while True:
+        block = f.read(BLOCK_SIZE)
+        if not block:
+            return
+        yield block
+
+
+def _file_digest(path: str) -> Optional[str]:
+    """SHA-256 of a file, read in blocks; None if it does not exist."""
+    digest = hashlib.sha256()
+    try:
+        with open(path, "rb") as f:
+            for block in _read_blocks(f):
+                digest.update(block)
+    except FileNotFoundError:
+        return None
+    return digest.hexdigest()
+
+
+def _gzip_file(source: str, target: str) -> None:
+    with open(source, "rb") as src, open(target, "wb") as raw:
+        # No file name or time in the header, so equal input gives equal bytes
+        with gzip.GzipFile("", "wb", 9, raw, mtime=0) as out:
+            for block in _read_blocks(src):
+                out.write(block)
+
+
+def _gunzip_digest(path: str) -> str:
+    digest = hashlib.sha256()
+    with gzip.open(path, "rb") as f:
+        for block in _read_blocks(f):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def _brotli_file(source: str, target: str) -> None:
+    compressor = brotli.Compressor(quality=11)
+    with open(source, "rb") as src, open(target, "wb") as out:
+        for block in _read_blocks(src):
+            out.write(compressor.process(block))
+        out.write(compressor.finish())
+
+
+def _unbrotli_digest(path: str) -> str:
+    decompressor = brotli.Decompressor()
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in _read_blocks(f):
+            digest.update(decompressor.process(block))
+    if not decompressor.is_finished():
+        raise brotli.error("Truncated brotli stream")
+    return digest.hexdigest()
+
+
+def precompress(path: str, digest: str) -> dict[str, tuple[int, bool]]:
+    """
+    Write maximum-compression gzip and brotli copies of an output file.
+
+    The brotli copy is only written when the brotli package is installed;
+    a leftover one is removed otherwise so it never goes stale. A copy that
+    already decompresses to content with the given digest is kept as is.
+    Files are compressed and checked in blocks, never read whole.
+
+    Args:
+        path: Path of the uncompressed file; copies get .gz/.br appended
+        digest: SHA-256 of the uncompressed file
+
+    Returns:
+        Mapping of suffix to (compressed size, whether it was rewritten)
+    """
+    codecs = [(".gz", _gzip_file, _gunzip_digest, (OSError, EOFError, zlib.error))]
+    if brotli is not None:
+        codecs.append((".br", _brotli_file, _unbrotli_digest, (brotli.error,)))
+    elif os.path.exists(path + ".br"):
+        os.remove(path + ".br")
+
+    sizes = {}
+    for suffix, compress, decompressed_digest, errors in codecs:
+        target = path + suffix
+        if os.path.exists(target):
+            try:
+                if decompressed_digest(target) == digest:
+                    sizes[suffix] = (os.path.getsize(target), False)
+                    continue
+            except errors:
+                pass
+        compress(path, target)
+        sizes[suffix] = (os.path.getsize(target), True)
+    return sizes
+
+
+class SiteWriter:
+    """
+    Writes the generated files only when their content changed.
+
+    Each file's SHA-256 is recorded in a manifest next to the page. The
+    workflow compares the manifest against the committed one to decide
+    whether anything needs deploying.
+    """
+
+    def __init__(self, root: str, compress: bool = False):
+        """
+        Args:
+            root: Directory the site is written to
+            compress: Also write .gz/.br copies of the main outputs
+        """
+        self.root = root
+        self.compress = compress
+        self.manifest_path = os.path.join(root, SITE_MANIFEST)
+        try:
+            with open(self.manifest_path, encoding="utf-8") as f:
+                self.previous: dict[str, str] = json.load(f)
+        except (OSError, json.JSONDecodeError):
+            self.previous = {}
+        self.hashes: dict[str, str] = {}
+        self.changed: list[str] = []
+
+    def write(
+        self, name: str, content: Union[str, Iterable[str]], compress: bool = False
+    ) -> bool:
+        """
+        Write a file under root unless it already has exactly this content.
+
+        Content given as chunks is streamed to a temporary file and hashed
+        on the way, so the whole file is never held in memory. The existing
+        file is only replaced when the hash differs.
+
+        Args:
+            name: Path relative to root, with forward slashes
+            content: File content, as one string or an iterable of chunks
+            compress: Also write precompressed copies (if enabled) and print
+                their sizes
+
+        Returns:
+            True if the file was written
+        """
+        path = os.path.join(self.root, *name.split("/"))
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        chunks = [content] if isinstance(content, str) else content
+
+        temp = path + ".tmp"
+        digest = hashlib.sha256()
+        size = 0
+        try:
+            with open(temp, "wb") as f:
+                for chunk in chunks:
+                    data = chunk.encode("utf-8")
+                    f.write(data)
+                    digest.update(data)
+                    size += len(data)
+        except BaseException:
+            os.remove(temp)
+            raise
+        digest = digest.hexdigest()
+        self.hashes[name] = digest
+
+        written = self.previous.get(name) != digest or _file_digest(path) != digest
+        if written:
+            os.replace(temp, path)
+            self.changed.append(name)
+        else:
+            os.remove(temp)
+
+        if compress and self.compress:
+            sizes = precompress(path, digest)
+            summary = ", ".join(
+                f"{suffix[1:]} {compressed:,} ({compressed / max(size, 1):.1%}"
+                f"{'' if rewritten else ', unchanged'})"
+                for suffix, (compressed, rewritten) in sizes.items()
+            )
+            print(f"Compressed {name} ({size:,} bytes): {summary}")
+        return written
+
+    def prune(self, directory: str) -> None:
+        """Remove HTML files under directory that were not written this run."""
+        for path in glob.glob(os.path.join(self.root, directory, "*.html")):
+            name = f"{directory}/{os.path.basename(path)}"
+            if name not in self.hashes:
+                os.remove(path)
+                self.changed.append(name)
+
+    def save(self) -> None:
+        """Write the manifest of artifact hashes and print what changed."""
+        if self.hashes != self.previous:
+            with open(self.manifest_path, "w", encoding="utf-8") as f:
+                json.dump(self.hashes, f, indent=2, sort_keys=True)
+                f.write("\n")
+        if self.changed:
+            shown = ", ".join(self.changed[:5])
+            more = f" and {len(self.changed) - 5} more" if len(self.changed) > 5 else ""
+            print(f"Changed {len(self.changed)} of {len(self.hashes)} artifact(s): {shown}{more}")
+        else:
+            print(f"No changes to the {len(self.hashes)} artifact(s)")
 
 
 def generate_html(
     db_path: str = "mods.db",
     output_path: str = "index.html",
     hero_image: str = "assets/img/logo.png",
+    use_cache: bool = True,
+    inline_days: Optional[int] = None,
+    days_dir: str = "days",
+    client_render: bool = False,
+    feed_name: str = "changelog.json",
+    compress: bool = False,
+    dedupe_cards: bool = False,
+    search_name: str = "search-index.json",
 ) -> int:
     """
     Generate the HTML file.
 
+    Files are only rewritten when their content changed, and their hashes
+    are recorded in site-manifest.json next to the page.
+
     Args:
         db_path: Path to the SQLite database
         output_path: Path for the output HTML file
         hero_image: Path to the hero image
+        use_cache: Reuse date sections rendered by earlier runs, stored in
+            the database's render_cache table
+        inline_days: Only put the latest N days in the page and write older
+            days to days_dir, loaded on demand by the date navigation
+        days_dir: Directory for the day fragments, next to output_path
+        client_render: Write the changelog data to feed_name and render the
+            cards in the browser instead of into the page
+        feed_name: File name of the feed, next to output_path
+        compress: Also write gzip (and brotli, if installed) copies of the
+            page, the feed and the search index and report their sizes; the
+            host compresses responses itself, so this is a local report
+        dedupe_cards: Emit each mod's card once as a template and have the
+            page's rows reference it
+        search_name: File name of the search index the page's search box
+            queries, next to output_path
 
     Returns:
         Number of mods generated
     """
-    mods = get_mods(db_path)
-    content, nav = generate_changelog_content(mods)
-    layout = page_layout(
-        title="BG3 Console Mod Tracker", content=content, hero_image_url=hero_image, date_nav_html=nav
-    )
-    html = html_document("BG3 Console Mod Tracker", layout)
+    search = SearchIndexBuilder()
+
+    def mods() -> Iterator[Mod]:
+        # One pass over the database feeds both the day groups and the search
+        # index, so the full catalogue is never held as Mod objects
+        for mod in iter_mods(db_path):
+            search.add(mod)
+            yield mod
+
+    writer = SiteWriter(os.path.dirname(output_path), compress)
+    page_name = os.path.basename(output_path)
+    cache = None
+    refs = CardRefs() if dedupe_cards and not client_render else None
+    if client_render:
+        content, nav, feed = generate_client_content(mods(), feed_name)
+        encoder = json.JSONEncoder(ensure_ascii=False, separators=(",", ":"))
+        writer.write(feed_name, encoder.iterencode(feed), compress=True)
+        size = os.path.getsize(os.path.join(writer.root, feed_name))
+        print(
+            f"Wrote {feed_name} ({size:,} bytes): "
+            f"{len(feed['mods'])} mods across {len(feed['days'])} days"
+        )
+        content_chunks, older = [content], []
+    else:
+        cache = RenderCache(db_path) if use_cache else None
+        content_chunks, nav, older = iter_changelog_content(
+            mods(), cache, inline_days, days_url=f"{days_dir}/", refs=refs
+        )
 
-    with open(output_path, "w", encoding="utf-8") as f:
-        f.write(html)
+    # The search box covers the whole catalogue, including days not in the page
+    if nav:
+        index = search.build()
+        encoder = json.JSONEncoder(ensure_ascii=False, separators=(",", ":"))
+        writer.write(search_name, encoder.iterencode(index), compress=True)
+        size = os.path.getsize(os.path.join(writer.root, search_name))
+        print(
+            f"Wrote {search_name} ({size:,} bytes): "
+            f"{len(index['tokens'])} tokens over {len(index['mods'])} mods"
+        )
+        nav += search_box()
+        content_chunks = itertools.chain(content_chunks, [search_script(search_name)])
 
-    return len(mods)
+    # Sections are rendered as they are written; the page is never built as one string
+    layout = iter_page_layout(
+        "BG3 Console Mod Tracker", content_chunks, hero_image_url=hero_image, date_nav_html=nav
+    )
+    writer.write(page_name, iter_html_document("BG3 Console Mod Tracker", layout), compress=True)
+    for day, section in older:
+        writer.write(f"{days_dir}/{day}.html", section)
+    writer.prune(days_dir)
+    writer.save()
+
+    if refs is not None and refs.rows:
+        print(
+            f"Card templates: {len(refs.cards)} mods for {refs.rows} rows, "
+            f"saved {refs.saved_bytes:,} of {refs.full_bytes:,} bytes "
+            f"({refs.saved_bytes / refs.full_bytes:.0%})"
+        )
+    if cache is not None:
+        cache.save()
+        total = cache.hits + cache.misses
+        if total:
+            print(
+                f"Render cache: reused {cache.hits}/{total} date sections "
+                f"({cache.hits / total:.0%}), rendered {cache.misses}"
+            )
 
+    return len(search)
 
-def main():
+
+def main(argv: Optional[list[str]] = None):
     """CLI entry point."""
-    count = generate_html()
+    parser = argparse.ArgumentParser(description="Generate index.html from mods.db.")
+    parser.add_argument(
+        "--inline-days",
+        type=int,
+        help="only put the latest N days in index.html, older days go to days/",
+    )
+    parser.add_argument(
+        "--client-render",
+        action="store_true",
+        help="write changelog.json and render the cards in the browser",
+    )
+    parser.add_argument(
+        "--compress",
+        action="store_true",
+        help="also write .gz/.br copies of the main outputs and report their sizes",
+    )
+    parser.add_argument(
+        "--dedupe-cards",
+        action="store_true",
+        help="emit each mod's card once and reference it from every day it appears",
+    )
+    args = parser.parse_args(argv)
+    if args.inline_days is not None and args.inline_days < 1:
+        parser.error("--inline-days must be at least 1")
+    if args.inline_days is not None and args.client_render:
+        parser.error("--inline-days and --client-render cannot be combined")
+    if args.dedupe_cards and args.client_render:
+        parser.error("--dedupe-cards and --client-render cannot be combined")
+
+    count = generate_html(
+        inline_days=args.inline_days,
+        client_render=args.client_render,
+        compress=args.compress,
+        dedupe_cards=args.dedupe_cards,
+    )
     print(f"Generated index.html with {count} entries")
 
 
@@ -0,0 +1,953 @@
+"""Incremental ingestion of data.json history into the mods database.
+
+Builds the same ``item`` / ``item_version`` / ``item_version_detail`` layout
+that ``git-history file`` produces, but keeps a checkpoint in the database so
+each run only replays the commits added since the previous one.
+"""
+
+import hashlib
+import json
+import os
+import sqlite3
+import subprocess
+import threading
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any, Iterator, Optional
+
+from .changelog_data import PLATFORMS, get_platform_versions, parse_epoch
+
+ID_COLUMN = "id"
+
+# How to handle a snapshot containing the same ID more than once:
+# "dedupe" keeps one record per ID, "skip" ignores the whole commit.
+DUPLICATE_MODES = ("dedupe", "skip")
+
+# Bump to rebuild mod_events from item_version on the next run
+EVENTS_VERSION = "3"
+
+# data.json only held mods available on this platform until the scrape was
+# widened to every tracked platform. Items first seen without it in that
+# commit (the "platform cutover") were already on mod.io, so they are seeded
+# without an "added" event unless their date_added shows they are new. The
+# scrape does a full sweep until it has stored such an item (see
+# scrape.predates_query), so the cutover snapshot holds all of them.
+ORIGINAL_PLATFORM = "ps5"
+
+# Number of consecutive commits handed to a worker process at a time
+CHUNK_SIZE = 16
+
+# Number of commits applied between database commits
+COMMIT_EVERY = 200
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS commits (
+    id INTEGER PRIMARY KEY,
+    hash TEXT UNIQUE,
+    commit_at TEXT
+);
+CREATE TABLE IF NOT EXISTS item (
+    _id INTEGER PRIMARY KEY,
+    _item_id TEXT UNIQUE,
+    _commit INTEGER REFERENCES commits(id),
+    _item_full_hash TEXT
+);
+CREATE TABLE IF NOT EXISTS item_version (
+    _id INTEGER PRIMARY KEY,
+    _item INTEGER REFERENCES item(_id),
+    _version INTEGER,
+    _commit INTEGER REFERENCES commits(id),
+    _item_full_hash TEXT
+);
+CREATE INDEX IF NOT EXISTS item_version_item ON item_version(_item, _version);
+CREATE TABLE IF NOT EXISTS columns (
+    id INTEGER PRIMARY KEY,
+    name TEXT UNIQUE
+);
+CREATE TABLE IF NOT EXISTS item_changed (
+    item_version INTEGER REFERENCES item_version(_id),
+    column INTEGER REFERENCES columns(id),
+    PRIMARY KEY (item_version, column)
+);
+CREATE TABLE IF NOT EXISTS ingest_state (
+    key TEXT PRIMARY KEY,
+    value TEXT
+);
+CREATE TABLE IF NOT EXISTS mod_events (
+    item_id INTEGER REFERENCES item(_id),
+    ts TEXT,
+    kind TEXT,
+    platform TEXT,
+    modfile_live INTEGER,
+    version INTEGER
+);
+CREATE INDEX IF NOT EXISTS mod_events_item ON mod_events(item_id, version);
+CREATE TABLE IF NOT EXISTS mod_platform_state (
+    item_id INTEGER REFERENCES item(_id),
+    platform TEXT,
+    modfile_live INTEGER,
+    PRIMARY KEY (item_id, platform)
+);
+CREATE VIEW IF NOT EXISTS item_version_detail AS
+SELECT
+    commits.commit_at AS _commit_at,
+    commits.hash AS _commit_hash,
+    item_version.*,
+    (
+        SELECT json_group_array(name) FROM columns
+        WHERE id IN (
+            SELECT column FROM item_changed
+            WHERE item_version = item_version._id
+        )
+    ) AS _changed_columns
+FROM item_version
+JOIN commits ON commits.id = item_version._commit;
+"""
+
+
+@dataclass
+class IngestStats:
+    """Counters describing a single ingestion run."""
+
+    commits: int = 0
+    items_added: int = 0
+    items_updated: int = 0
+    items_backfilled: int = 0
+    skipped_commits: int = 0
+    unchanged_commits: int = 0
+    duplicate_commits: int = 0
+    duplicate_items: int = 0
+
+
+@dataclass
+class CommitDiff:
+    """Items of one snapshot that differ from the snapshot before it."""
+
+    dropped: int = 0
+    skipped: bool = False
+    # (_item_id, _item_full_hash, item) for every new or changed item
+    changes: list[tuple[str, str, dict]] = field(default_factory=list)
+
+
+def _hash(value: Any) -> str:
+    """Stable content hash, compatible with git-history's ``_item_full_hash``."""
+    return hashlib.sha1(
+        json.dumps(value, separators=(",", ":"), sort_keys=True, default=repr).encode(
+            "utf8"
+        )
+    ).hexdigest()
+
+
+def _to_column(value: Any) -> Any:
+    """Convert a JSON value to the representation stored in SQLite."""
+    if isinstance(value, (dict, list)):
+        return json.dumps(value, default=repr, sort_keys=True, ensure_ascii=False)
+    return value
+
+
+def dedupe_items(items: list[dict]) -> tuple[list[dict], int]:
+    """
+    Keep one record per ID.
+
+    The record with the highest ``date_updated`` wins; ties go to the record
+    that appears last in the file, so the result only depends on the input.
+
+    Args:
+        items: Parsed contents of data.json
+
+    Returns:
+        Tuple of (deduplicated items in original order, number of records dropped)
+    """
+    winners: dict[Any, int] = {}
+    for index, item in enumerate(items):
+        key = item.get(ID_COLUMN)
+        current = winners.get(key)
+        if current is None or (item.get("date_updated") or 0) >= (
+            items[current].get("date_updated") or 0
+        ):
+            winners[key] = index
+    kept = sorted(winners.values())
+    return [items[index] for index in kept], len(items) - len(kept)
+
+
+def _git(repo_path: str, *args: str) -> str:
+    """Run a git command and return its stdout."""
+    result = subprocess.run(
+        ["git", *args], cwd=repo_path, capture_output=True, text=True, check=True
+    )
+    return result.stdout
+
+
+def _is_ancestor(repo_path: str, commit: str, head: str = "HEAD") -> bool:
+    """Check whether commit is reachable from head."""
+    result = subprocess.run(
+        ["git", "merge-base", "--is-ancestor", commit, head],
+        cwd=repo_path,
+        capture_output=True,
+    )
+    return result.returncode == 0
+
+
+def list_commits(
+    repo_path: str, data_path: str, since: Optional[str] = None
+) -> list[tuple[str, str]]:
+    """
+    List commits touching data_path, oldest first.
+
+    Args:
+        repo_path: Path to the git repository
+        data_path: Path of the JSON file inside the repository
+        since: Only return commits after this one
+
+    Returns:
+        List of (commit hash, ISO commit date) tuples
+    """
+    revision = f"{since}..HEAD" if since else "HEAD"
+    output = _git(
+        repo_path, "log", "--reverse", "--format=%H %cI", revision, "--", data_path
+    )
+    return [tuple(line.split(" ", 1)) for line in output.splitlines() if line]
+
+
+def blob_ids(repo_path: str, commits: list[str], data_path: str) -> list[Optional[str]]:
+    """
+    Look up the blob SHA of data_path at each commit with ``git cat-file --batch-check``.
+
+    Args:
+        repo_path: Path to the git repository
+        commits: Commit hashes, in order
+        data_path: Path of the JSON file inside the repository
+
+    Returns:
+        Blob SHA for each commit, or None if the file is missing there
+    """
+    specs = "".join(f"{commit}:{data_path}\n" for commit in commits)
+    output = subprocess.run(
+        ["git", "cat-file", "--batch-check"],
+        cwd=repo_path,
+        input=specs,
+        capture_output=True,
+        text=True,
+        check=True,
+    ).stdout
+    return [
+        None if line.endswith(" missing") else line.split(" ", 1)[0]
+        for line in output.splitlines()
+    ]
+
+
+def read_blobs(repo_path: str, objects: list[str]) -> Iterator[bytes]:
+    """
+    Stream object contents through a single ``git cat-file --batch``.
+
+    Args:
+        repo_path: Path to the git repository
+        objects: Object names to read, in order
+
+    Yields:
+        Contents of each object
+    """
+    process = subprocess.Popen(
+        ["git", "cat-file", "--batch"],
+        cwd=repo_path,
+        stdin=subprocess.PIPE,
+        stdout=subprocess.PIPE,
+    )
+
+    def feed() -> None:
+        try:
+            for name in objects:
+                process.stdin.write(f"{name}\n".encode())
+            process.stdin.close()
+        except (BrokenPipeError, ValueError):
+            pass
+
+    writer = threading.Thread(target=feed, daemon=True)
+    writer.start()
+    try:
+        for _ in objects:
+            size = int(process.stdout.readline().split()[2])
+            data = process.stdout.read(size)
+            process.stdout.read(1)
+            yield data
+    finally:
+        if process.poll() is None:
+            process.kill()
+        process.stdout.close()
+        process.wait()
+        writer.join()
+
+
+def is_store(repo_path: str, data_path: str, commit: str = "HEAD") -> bool:
+    """Check whether data_path is a sharded store directory at commit."""
+    result = subprocess.run(
+        ["git", "cat-file", "-t", f"{commit}:{data_path}"],
+        cwd=repo_path,
+        capture_output=True,
+        text=True,
+    )
+    return result.stdout.strip() == "tree"
+
+
+def store_changes(
+    repo_path: str, trees: list[str], previous: Optional[str]
+) -> list[list[str]]:
+    """
+    List the mod files added or modified in each store tree.
+
+    Consecutive trees are compared with one ``git diff-tree --stdin``, so
+    only the paths that changed are looked at. The first tree is listed in
+    full with ``git ls-tree`` when there is no previous tree.
+
+    Args:
+        repo_path: Path to the git repository
+        trees: Store tree SHAs, in commit order
+        previous: Store tree just before the first one, if any
+
+    Returns:
+        Blob SHAs of the changed mod files, one list per tree
+    """
+    changes: list[list[str]] = []
+    pairs = list(zip([previous, *trees], trees))
+    if pairs and pairs[0][0] is None:
+        listing = _git(repo_path, "ls-tree", "-r", pairs.pop(0)[1])
+        changes.append(
+            [
+                line.split()[2]
+                for line in listing.splitlines()
+                if line.split("\t", 1)[1].startswith("mods/")
+            ]
+        )
+    if not pairs:
+        return changes
+
+    output = subprocess.run(
+        ["git", "diff-tree", "--stdin", "-r", "--raw", "--no-renames", "--always"],
+        cwd=repo_path,
+        input="".join(f"{old} {new}\n" for old, new in pairs),
+        capture_output=True,
+        text=True,
+        check=True,
+    ).stdout
+    for line in output.splitlines():
+        if not line.startswith(":"):
+            # Header echoing the pair of trees compared next
+            changes.append([])
+            continue
+        meta, path = line.split("\t", 1)
+        _, _, _, new_id, status = meta.split()
+        if status in ("A", "M") and path.startswith("mods/"):
+            changes[-1].append(new_id)
+    return changes
+
+
+def iter_store_diffs(
+    repo_path: str, trees: list[str], previous: Optional[str]
+) -> Iterator[CommitDiff]:
+    """
+    Diff sharded store trees, reading only the mod files that changed.
+
+    Mods whose file was deleted are not reported, just as a mod missing from
+    a data.json snapshot is not.
+
+    Args:
+        repo_path: Path to the git repository
+        trees: Store tree SHAs, in commit order
+        previous: Store tree just before the first one, if any
+
+    Yields:
+        One CommitDiff per tree
+    """
+    changes = store_changes(repo_path, trees, previous)
+    blobs = read_blobs(repo_path, [blob for blob_ids in changes for blob in blob_ids])
+    try:
+        for blob_ids in changes:
+            diff = CommitDiff()
+            for _ in blob_ids:
+                item = json.loads(next(blobs))
+                item_id = _hash({ID_COLUMN: item.get(ID_COLUMN)})
+                diff.changes.append((item_id, _hash(item), item))
+            # Apply in ID order, like records in data.json, not in path order
+            diff.changes.sort(key=lambda change: change[2].get(ID_COLUMN))
+            yield diff
+    finally:
+        blobs.close()
+
+
+def _parse_snapshot(blob: bytes, on_duplicate: str) -> tuple[Optional[dict], int]:
+    """
+    Parse a snapshot into {id: item}.
+
+    Returns:
+        Tuple of (items by ID or None if the snapshot is skipped,
+        number of duplicate records dropped)
+    """
+    items, dropped = dedupe_items(json.loads(blob))
+    if dropped and on_duplicate == "skip":
+        return None, dropped
+    return {item.get(ID_COLUMN): item for item in items}, dropped
+
+
+def split_records(blob: bytes) -> Optional[dict[Any, bytes]]:
+    """
+    Split a snapshot written one record per line into {id: line}.
+
+    This is the layout ``scrape.write_data`` produces: ``[``, then one
+    compact record per line starting with its ID, then ``]``. Only the ID is
+    read from each line; the records themselves are not parsed.
+
+    Args:
+        blob: Raw data.json snapshot
+
+    Returns:
+        Record lines by ID without their trailing commas, or None when the
+        snapshot is not in that layout or repeats an ID
+    """
+    lines = blob.split(b"\n")
+    if lines and lines[-1] == b"":
+        lines.pop()
+    if len(lines) < 2 or lines[0] != b"[" or lines[-1] != b"]":
+        return None
+    prefix = b'{"%s":' % ID_COLUMN.encode()
+    records: dict[Any, bytes] = {}
+    for line in lines[1:-1]:
+        if line.endswith(b","):
+            line = line[:-1]
+        if not line.startswith(prefix):
+            return None
+        end = line.find(b",", len(prefix))
+        try:
+            key = int(line[len(prefix) : end])
+        except ValueError:
+            return None
+        if key in records:
+            return None
+        records[key] = line
+    return records
+
+
+def diff_chunk(
+    previous: Optional[bytes], blobs: list[bytes], on_duplicate: str
+) -> list[CommitDiff]:
+    """
+    Parse a run of consecutive snapshots and diff each against the one before.
+
+    Runs in a worker process. Items equal to their record in the preceding
+    snapshot are dropped before anything is hashed, so unchanged items cost
+    a dict comparison. Snapshots in the one-record-per-line layout are
+    compared line by line instead, and only the changed lines are parsed.
+    When the preceding snapshot is unknown every item is reported and the
+    caller filters against its stored hashes.
+
+    Args:
+        previous: Snapshot just before the first blob, if any
+        blobs: Snapshots in commit order
+        on_duplicate: Duplicate handling mode, see DUPLICATE_MODES
+
+    Returns:
+        One CommitDiff per blob
+    """
+    # The preceding snapshot, as record lines if it has that layout and as
+    # parsed items otherwise (or once a full parse needed them)
+    base_lines: Optional[dict[Any, bytes]] = None
+    base: Optional[dict] = None
+    if previous is not None:
+        base_lines = split_records(previous)
+        if base_lines is None:
+            base, _ = _parse_snapshot(previous, on_duplicate)
+
+    results: list[CommitDiff] = []
+    for blob in blobs:
+        lines = split_records(blob)
+        if lines is not None:
+            changes = []
+            for key, line in lines.items():
+                if base_lines is not None and base_lines.get(key) == line:
+                    continue
+                item = json.loads(line)
+                if base is not None and base.get(key) == item:
+                    continue
+                changes.append((_hash({ID_COLUMN: key}), _hash(item), item))
+            results.append(CommitDiff(changes=changes))
+            base_lines, base = lines, None
+            continue
+
+        items, dropped = _parse_snapshot(blob, on_duplicate)
+        if items is None:
+            results.append(CommitDiff(dropped=dropped, skipped=True))
+            continue
+        if base is None and base_lines is not None:
+            base = {key: json.loads(line) for key, line in base_lines.items()}
+        changes = [
+            (_hash({ID_COLUMN: key}), _hash(item), item)
+            for key, item in items.items()
+            if base is None or base.get(key) != item
+        ]
+        results.append(CommitDiff(dropped=dropped, changes=changes))
+        base_lines, base = None, items
+    return results
+
+
+def iter_diffs(
+    blobs: Iterator[bytes],
+    previous: Optional[bytes],
+    on_duplicate: str,
+    workers: int = 1,
+) -> Iterator[CommitDiff]:
+    """
+    Diff a stream of snapshots, in parallel when workers > 1.
+
+    Results are yielded in commit order, so the output is identical to a
+    serial run regardless of the number of workers. Chunks already in the
+    one-record-per-line layout are diffed in this process, since shipping
+    them to a worker costs more than the line comparison itself.
+
+    Args:
+        blobs: Snapshots in commit order
+        previous: Snapshot just before the first blob, if any
+        on_duplicate: Duplicate handling mode, see DUPLICATE_MODES
+        workers: Number of worker processes
+
+    Yields:
+        One CommitDiff per blob
+    """
+
+    def chunks() -> Iterator[tuple[Optional[bytes], list[bytes]]]:
+        base = previous
+        chunk: list[bytes] = []
+        for blob in blobs:
+            chunk.append(blob)
+            if len(chunk) == CHUNK_SIZE:
+                yield base, chunk
+                base = chunk[-1]
+                chunk = []
+        if chunk:
+            yield base, chunk
+
+    if workers <= 1:
+        for base, chunk in chunks():
+            yield from diff_chunk(base, chunk, on_duplicate)
+        return
+
+    def line_layout(blob: Optional[bytes]) -> bool:
+        return blob is None or blob.startswith(b'[\n{"%s":' % ID_COLUMN.encode())
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        pending = deque()
+        for base, chunk in chunks():
+            if line_layout(base) and all(line_layout(blob) for blob in chunk):
+                # Cheaper to diff here than to ship the snapshots to a worker
+                while pending:
+                    yield from pending.popleft().result()
+                yield from diff_chunk(base, chunk, on_duplicate)
+                continue
+            pending.append(pool.submit(diff_chunk, base, chunk, on_duplicate))
+            # Bound the number of snapshots held in memory at once
+            if len(pending) >= workers * 2:
+                yield from pending.popleft().result()
+        while pending:
+            yield from pending.popleft().result()
+
+
+class Ingester:
+    """Applies data.json snapshots to the database one commit at a time."""
+
+    def __init__(self, connection: sqlite3.Connection, on_duplicate: str = "dedupe"):
+        if on_duplicate not in DUPLICATE_MODES:
+            raise ValueError(f"on_duplicate must be one of {DUPLICATE_MODES}")
+        self.connection = connection
+        self.on_duplicate = on_duplicate
+        self.stats = IngestStats()
+        self.columns: dict[str, int] = dict(
+            connection.execute("SELECT name, id FROM columns").fetchall()
+        )
+        # _item_id -> (_id, _item_full_hash, latest _version)
+        self.items: dict[str, tuple[int, str, int]] = {}
+        for row_id, item_id, full_hash, version in connection.execute(
+            """
+            SELECT item._id, item._item_id, item._item_full_hash,
+                (SELECT MAX(_version) FROM item_version WHERE _item = item._id)
+            FROM item
+            """
+        ):
+            self.items[item_id] = (row_id, full_hash, version or 0)
+        # (_item, platform) -> last modfile_live seen for change detection
+        self.platform_state: dict[tuple[int, str], int] = {
+            (item, platform): live
+            for item, platform, live in connection.execute(
+                "SELECT item_id, platform, modfile_live FROM mod_platform_state"
+            )
+        }
+        # Commit time of the latest snapshot, for telling new items from backfilled ones
+        row = connection.execute(
+            "SELECT commit_at FROM commits ORDER BY id DESC LIMIT 1"
+        ).fetchone()
+        self.last_commit_at: Optional[str] = row[0] if row else None
+        self.cutover = self.get_state("platform_cutover")
+        if self.get_state("events_version") != EVENTS_VERSION:
+            self.rebuild_events()
+
+    def get_state(self, key: str) -> Optional[str]:
+        """Read a checkpoint value."""
+        row = self.connection.execute(
+            "SELECT value FROM ingest_state WHERE key = ?", (key,)
+        ).fetchone()
+        return row[0] if row else None
+
+    def set_state(self, key: str, value: str) -> None:
+        """Persist a checkpoint value."""
+        self.connection.execute(
+            "INSERT OR REPLACE INTO ingest_state (key, value) VALUES (?, ?)",
+            (key, value),
+        )
+
+    def is_backfill(
+        self,
+        commit_hash: str,
+        previous_commit_at: Optional[str],
+        platforms: Optional[str],
+        date_added: Any,
+    ) -> bool:
+        """
+        Check whether a newly seen item only appeared because the scrape was widened.
+
+        The first item seen without ORIGINAL_PLATFORM marks its commit as
+        the platform cutover. Items first seen without that platform in the
+        cutover commit are backfill, unless mod.io added them after the
+        snapshot before it.
+
+        Args:
+            commit_hash: Commit the item was first seen in
+            previous_commit_at: ISO timestamp of the snapshot before it
+            platforms: The item's first platforms column
+            date_added: The item's mod.io date_added (Unix seconds), if stored
+        """
+        if ORIGINAL_PLATFORM in get_platform_versions(platforms):
+            return False
+        if self.cutover is None:
+            self.cutover = commit_hash
+            self.set_state("platform_cutover", commit_hash)
+        if commit_hash != self.cutover or previous_commit_at is None:
+            return False
+        try:
+            return int(date_added) < parse_epoch(previous_commit_at)
+        except (TypeError, ValueError):
+            return True
+
+    def record_events(
+        self,
+        row_id: int,
+        version: int,
+        commit_at: str,
+        platforms: Optional[str],
+        backfill: bool = False,
+    ) -> None:
+        """
+        Append the change events implied by a new item version.
+
+        The first version of an item is an "added" event, with one row per
+        tracked platform it is live on (a single row without a platform if
+        none). Later versions add one "updated" event per tracked platform
+        whose modfile_live went up; all platforms are read from a single
+        parse of the platforms column.
+
+        Args:
+            row_id: The item's ``_id``
+            version: The new ``_version``
+            commit_at: ISO timestamp of the commit
+            platforms: The version's platforms column (None if unchanged)
+            backfill: Seed the platform state of a first version without
+                an "added" event; see ``is_backfill``
+        """
+        new_versions = get_platform_versions(platforms)
+        if version == 1 and not backfill:
+            live = [
+                (name, new_versions[name]) for name in PLATFORMS if new_versions.get(name, 0) > 0
+            ]
+            self.connection.executemany(
+                "INSERT INTO mod_events (item_id, ts, kind, platform, modfile_live, version) "
+                "VALUES (?, ?, 'added', ?, ?, ?)",
+                [
+                    (row_id, commit_at, platform, modfile_live, version)
+                    for platform, modfile_live in live or [(None, None)]
+                ],
+            )
+
+        for platform in PLATFORMS:
+            key = (row_id, platform)
+            new_ver = new_versions.get(platform, 0)
+            if version > 1 and new_ver > self.platform_state.get(key, 0):
+                self.connection.execute(
+                    "INSERT INTO mod_events (item_id, ts, kind, platform, modfile_live, version) "
+                    "VALUES (?, ?, 'updated', ?, ?, ?)",
+                    (row_id, commit_at, platform, new_ver, version),
+                )
+            if new_ver > 0:
+                self.platform_state[key] = new_ver
+                self.connection.execute(
+                    "INSERT OR REPLACE INTO mod_platform_state (item_id, platform, modfile_live) "
+                    "VALUES (?, ?, ?)",
+                    (row_id, platform, new_ver),
+                )
+
+    def rebuild_events(self) -> None:
+        """Recompute mod_events from the stored item versions."""
+        self.connection.execute("DELETE FROM mod_events")
+        self.connection.execute("DELETE FROM mod_platform_state")
+        self.platform_state = {}
+        date_added = "item_version.date_added" if "date_added" in self.columns else "NULL"
+        versions = self.connection.execute(
+            f"""
+            SELECT item_version._item, item_version._version, commits.commit_at,
+                item_version.platforms, commits.hash,
+                CASE WHEN item_version._version = 1 THEN (
+                    SELECT previous.commit_at FROM commits AS previous
+                    WHERE previous.id < commits.id
+                    ORDER BY previous.id DESC LIMIT 1
+                ) END,
+                {date_added}
+            FROM item_version
+            JOIN commits ON commits.id = item_version._commit
+            ORDER BY item_version._item, item_version._version
+            """
+            if "platforms" in self.columns
+            else "SELECT 1 WHERE 0"
+        ).fetchall()
+        if self.cutover is None and versions:
+            # The cutover is the first commit that added an item without
+            # ORIGINAL_PLATFORM; find it before replaying items in item order
+            first_versions = self.connection.execute(
+                """
+                SELECT commits.hash, item_version.platforms
+                FROM item_version
+                JOIN commits ON commits.id = item_version._commit
+                WHERE item_version._version = 1
+                ORDER BY commits.id
+                """
+            )
+            for commit_hash, platforms in first_versions:
+                if ORIGINAL_PLATFORM not in get_platform_versions(platforms):
+                    self.cutover = commit_hash
+                    self.set_state("platform_cutover", commit_hash)
+                    break
+        for row_id, version, commit_at, platforms, commit_hash, previous_at, added in versions:
+            backfill = version == 1 and self.is_backfill(
+                commit_hash, previous_at, platforms, added
+            )
+            self.record_events(row_id, version, commit_at, platforms, backfill)
+        self.set_state("events_version", EVENTS_VERSION)
+
+    def _ensure_columns(self, names: Iterator[str]) -> None:
+        """Add any columns not seen before to item and item_version."""
+        for name in names:
+            if name in self.columns:
+                continue
+            for table in ("item", "item_version"):
+                self.connection.execute(f'ALTER TABLE {table} ADD COLUMN "{name}"')
+            cursor = self.connection.execute(
+                "INSERT INTO columns (name) VALUES (?)", (name,)
+            )
+            self.columns[name] = cursor.lastrowid
+
+    def apply_commit(self, commit_hash: str, commit_at: str, diff: CommitDiff) -> None:
+        """
+        Record one data.json snapshot.
+
+        Args:
+            commit_hash: Commit the snapshot was read from
+            commit_at: ISO timestamp of the commit
+            diff: Items that changed in this snapshot
+        """
+        if diff.skipped:
+            print(f"Skipping commit {commit_hash}: found multiple items with the same ID")
+            self.stats.skipped_commits += 1
+            return
+        if diff.dropped:
+            print(f"Commit {commit_hash}: dropped {diff.dropped} duplicate item(s)")
+            self.stats.duplicate_commits += 1
+            self.stats.duplicate_items += diff.dropped
+
+        cursor = self.connection.execute(
+            "INSERT INTO commits (hash, commit_at) VALUES (?, ?)",
+            (commit_hash, commit_at),
+        )
+        commit_id = cursor.lastrowid
+        self.stats.commits += 1
+
+        for item_id, full_hash, item in diff.changes:
+            existing = self.items.get(item_id)
+            if existing is not None and existing[1] == full_hash:
+                continue
+
+            self._ensure_columns(iter(item))
+            row = {key: _to_column(value) for key, value in item.items()}
+
+            if existing is None:
+                changed = row
+                version = 1
+                backfill = self.is_backfill(
+                    commit_hash, self.last_commit_at, row.get("platforms"), item.get("date_added")
+                )
+                cursor = self.connection.execute(
+                    "INSERT INTO item (_item_id, _commit, _item_full_hash) VALUES (?, ?, ?)",
+                    (item_id, commit_id, full_hash),
+                )
+                row_id = cursor.lastrowid
+                self.stats.items_added += 1
+            else:
+                row_id, _, previous_version = existing
+                version = previous_version + 1
+                names = ", ".join(f'"{key}"' for key in row)
+                previous = self.connection.execute(
+                    f"SELECT {names} FROM item WHERE _id = ?", (row_id,)
+                ).fetchone()
+                changed = {
+                    key: value
+                    for (key, value), old in zip(row.items(), previous)
+                    if value != old
+                }
+                backfill = False
+                self.stats.items_updated += 1
+
+            assignments = ", ".join(f'"{key}" = ?' for key in row)
+            self.connection.execute(
+                f"UPDATE item SET {assignments}, _commit = ?, _item_full_hash = ? WHERE _id = ?",
+                (*row.values(), commit_id, full_hash, row_id),
+            )
+
+            names = "".join(f', "{key}"' for key in changed)
+            placeholders = ", ?" * len(changed)
+            cursor = self.connection.execute(
+                f"INSERT INTO item_version (_item, _version, _commit, _item_full_hash{names}) "
+                f"VALUES (?, ?, ?, ?{placeholders})",
+                (row_id, version, commit_id, full_hash, *changed.values()),
+            )
+            self.connection.executemany(
+                "INSERT INTO item_changed (item_version, column) VALUES (?, ?)",
+                [(cursor.lastrowid, self.columns[key]) for key in changed],
+            )
+            self.items[item_id] = (row_id, full_hash, version)
+            self.record_events(row_id, version, commit_at, changed.get("platforms"), backfill)
+            if backfill:
+                self.stats.items_backfilled += 1
+        self.last_commit_at = commit_at
+
+
+def _reset(connection: sqlite3.Connection) -> None:
+    """Drop all ingested data so the history can be rebuilt from scratch."""
+    connection.executescript(
+        """
+        DROP VIEW IF EXISTS item_version_detail;
+        DROP TABLE IF EXISTS mod_events;
+        DROP TABLE IF EXISTS mod_platform_state;
+        DROP TABLE IF EXISTS item_changed;
+        DROP TABLE IF EXISTS columns;
+        DROP TABLE IF EXISTS item_version;
+        DROP TABLE IF EXISTS item;
+        DROP TABLE IF EXISTS commits;
+        DROP TABLE IF EXISTS ingest_state;
+        """
+    )
+    connection.executescript(SCHEMA)
+
+
+def ingest(
+    db_path: str = "mods.db",
+    data_path: str = "data.json",
+    repo_path: str = ".",
+    on_duplicate: str = "dedupe",
+    workers: Optional[int] = None,
+) -> IngestStats:
+    """
+    Ingest new commits of data_path into the database.
+
+    Only commits after the stored checkpoint are replayed. If the checkpoint
+    is no longer part of the branch history the database is rebuilt.
+
+    data_path may also name a sharded store directory (see
+    ``scrape.write_store``); only the mod files that changed between commits
+    are then read.
+
+    Args:
+        db_path: Path to the SQLite database
+        data_path: Path of the JSON file or store directory inside the repository
+        repo_path: Path to the git repository
+        on_duplicate: "dedupe" to keep one record per duplicated ID,
+            "skip" to ignore commits that contain duplicates
+        workers: Number of processes used to parse snapshots
+            (defaults to the number of CPUs)
+
+    Returns:
+        Counters for the commits and items processed
+    """
+    connection = sqlite3.connect(db_path)
+    connection.executescript(SCHEMA)
+
+    ingester = Ingester(connection, on_duplicate)
+    last_commit = ingester.get_state("last_commit")
+    if last_commit and (
+        ingester.get_state("data_path") != data_path
+        or not _is_ancestor(repo_path, last_commit)
+    ):
+        print(f"Checkpoint {last_commit} is not in the current history, rebuilding")
+        _reset(connection)
+        ingester = Ingester(connection, on_duplicate)
+        last_commit = None
+
+    commits = list_commits(repo_path, data_path, since=last_commit)
+    print(f"Ingesting {len(commits)} new commit(s) of {data_path}")
+
+    if workers is None:
+        workers = os.cpu_count() or 1
+    # Small incremental runs are not worth starting a process pool for
+    if len(commits) <= CHUNK_SIZE:
+        workers = 1
+
+    hashes = [commit_hash for commit_hash, _ in commits]
+    if last_commit:
+        hashes.insert(0, last_commit)
+    ids = blob_ids(repo_path, hashes, data_path)
+    previous_id = ids.pop(0) if last_commit else None
+
+    # Only read snapshots whose blob differs from the one before
+    distinct = []
+    last_id = previous_id
+    for blob_id in ids:
+        if blob_id is not None and blob_id != last_id:
+            distinct.append(blob_id)
+            last_id = blob_id
+
+    store = is_store(repo_path, data_path)
+    if store:
+        # The IDs above are store trees rather than data.json blobs
+        diffs = iter_store_diffs(repo_path, distinct, previous_id)
+    else:
+        blobs = read_blobs(repo_path, ([previous_id] if previous_id else []) + distinct)
+        previous = next(blobs) if previous_id else None
+        diffs = iter_diffs(blobs, previous, on_duplicate, workers)
+
+    last_id = previous_id
+    last_diff = CommitDiff()
+    for count, ((commit_hash, commit_at), blob_id) in enumerate(zip(commits, ids), 1):
+        if blob_id is None:
+            diff = None
+        elif blob_id == last_id:
+            diff = CommitDiff(dropped=last_diff.dropped, skipped=last_diff.skipped)
+            ingester.stats.unchanged_commits += 1
+        else:
+            diff = last_diff = next(diffs)
+            last_id = blob_id
+        if diff is not None:
+            ingester.apply_commit(commit_hash, commit_at, diff)
+        ingester.set_state("last_commit", commit_hash)
+        ingester.set_state("data_path", data_path)
+        if count % COMMIT_EVERY == 0:
+            connection.commit()
+    connection.commit()
+    diffs.close()
+    if not store:
+        blobs.close()
+
+    connection.close()
+    return ingester.stats
@@ -0,0 +1,866 @@
+"""Scrape console mods from the mod.io API into data.json."""
+
+import argparse
+import hashlib
+import http.client
+import json
+import os
+import queue
+import random
+import sys
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Any, Iterator, Optional
+from urllib.parse import parse_qsl, urlencode, urlsplit
+
+PAGE_LIMIT = 100
+
+# Maximum number of requests in flight (and open connections)
+CONCURRENCY = 8
+
+# Query parameters sent with every page request, besides the API key and sort
+QUERY = {"platforms-in": "ps5,xboxseriesx"}
+
+# Platform data.json was limited to before QUERY was widened. A delta from
+# such data would only pick up the other platforms' recently updated mods,
+# and the rest would arrive at the next full sweep looking like new mods.
+# While no stored mod lacks it the run is a full sweep instead, so the
+# first snapshot with other platforms' mods is complete (see
+# ingest.ORIGINAL_PLATFORM). At worst that is a full sweep every hour.
+ORIGINAL_PLATFORM = "ps5"
+
+# A full sweep pages by the immutable ID, so mods updated mid-sweep cannot
+# shift across page boundaries; a delta walks newest first to its watermark
+FULL_SORT = "id"
+DELTA_SORT = "-date_updated"
+
+# UTC hour at which the hourly run does a full sweep to pick up deletions
+FULL_SWEEP_HOUR = 0
+
+# Assumed quota until the API reports one: RATE_LIMIT requests per RATE_WINDOW seconds
+RATE_LIMIT = 60
+RATE_WINDOW = 60
+
+# Retries for 5xx responses and transport errors, with jittered exponential backoff
+MAX_RETRIES = 5
+BACKOFF_BASE = 1.0
+BACKOFF_MAX = 60.0
+
+# Record key that data.json is sorted by and that leads every record line
+ID_FIELD = "id"
+
+# Arrays written in sorted order, since the API does not fix their order
+SORTED_ARRAYS = ("tags", "platforms", "dependencies")
+
+# Sharded store layout: <store>/mods/<id % SHARD_COUNT>/<id>.json plus a manifest
+SHARD_COUNT = 256
+STORE_MANIFEST = "manifest.json"
+
+# Directory and size bound of the on-disk page cache
+CACHE_DIR = ".scrape-cache"
+CACHE_MAX_BYTES = 64 * 1024 * 1024
+
+# Transport failures worth retrying (socket errors, timeouts, truncated responses)
+TRANSPORT_ERRORS = (OSError, http.client.HTTPException)
+
+
+@dataclass
+class ScrapeStats:
+    """Counters describing a single scrape run."""
+
+    mode: str = "full"
+    pages: int = 0
+    records: int = 0
+    mods: int = 0
+    seconds: float = 0.0
+    retries: int = 0
+    throttled: int = 0
+    rate_wait: float = 0.0
+    backoff_wait: float = 0.0
+    cache_hits: int = 0
+    cache_misses: int = 0
+    files_changed: int = 0
+
+
+@dataclass
+class CachedPage:
+    """Index entry for one cached page; the records live in their own file."""
+
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+    digest: str = ""
+    total: Optional[int] = None
+    size: int = 0
+    used: float = 0.0
+
+
+class ResponseCache:
+    """
+    On-disk cache of projected pages, keyed by request URL without the API key.
+
+    Each entry keeps the page's validators (ETag / Last-Modified) and a hash
+    of the raw body next to the projected records, so an unchanged page is
+    answered from disk either by a 304 or by a matching hash, without being
+    projected again. The least recently used entries are evicted on save
+    once the records on disk exceed max_bytes.
+    """
+
+    INDEX = "index.json"
+
+    def __init__(self, directory: str, max_bytes: int = CACHE_MAX_BYTES):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.entries: dict[str, CachedPage] = {}
+        os.makedirs(directory, exist_ok=True)
+        try:
+            with open(os.path.join(directory, self.INDEX), encoding="utf-8") as f:
+                for key, entry in json.load(f).items():
+                    self.entries[key] = CachedPage(**entry)
+        except (OSError, ValueError, TypeError):
+            # A missing or unreadable index just means a cold cache
+            self.entries = {}
+
+    @staticmethod
+    def key(target: str) -> str:
+        """Cache key for a request target, with the API key removed."""
+        parts = urlsplit(target)
+        params = [(k, v) for k, v in parse_qsl(parts.query) if k != "api_key"]
+        return f"{parts.path}?{urlencode(sorted(params))}"
+
+    def _path(self, key: str) -> str:
+        name = hashlib.sha1(key.encode()).hexdigest()
+        return os.path.join(self.directory, f"{name}.json")
+
+    def get(self, key: str) -> Optional[CachedPage]:
+        """Look up the index entry for key, if its records are on disk."""
+        with self.lock:
+            entry = self.entries.get(key)
+        if entry is None or not os.path.exists(self._path(key)):
+            return None
+        return entry
+
+    def load(self, key: str, entry: CachedPage) -> list[dict]:
+        """Read the cached records for key and count a hit."""
+        with open(self._path(key), encoding="utf-8") as f:
+            records = json.load(f)
+        with self.lock:
+            entry.used = time.time()
+            self.hits += 1
+        return records
+
+    def put(self, key: str, entry: CachedPage, records: list[dict]) -> None:
+        """Store freshly projected records for key and count a miss."""
+        data = json.dumps(records, ensure_ascii=False).encode("utf-8")
+        with open(self._path(key), "wb") as f:
+            f.write(data)
+        entry.size = len(data)
+        entry.used = time.time()
+        with self.lock:
+            self.entries[key] = entry
+            self.misses += 1
+
+    def save(self) -> None:
+        """Evict least recently used entries over the size bound and write the index."""
+        with self.lock:
+            kept: dict[str, CachedPage] = {}
+            size = 0
+            for key, entry in sorted(
+                self.entries.items(), key=lambda item: item[1].used, reverse=True
+            ):
+                if size + entry.size > self.max_bytes:
+                    try:
+                        os.remove(self._path(key))
+                    except FileNotFoundError:
+                        pass
+                    continue
+                kept[key] = entry
+                size += entry.size
+            self.entries = kept
+            index = {key: entry.__dict__ for key, entry in kept.items()}
+        with open(os.path.join(self.directory, self.INDEX), "w", encoding="utf-8") as f:
+            json.dump(index, f)
+
+
+class RateLimiter:
+    """
+    Token bucket shared by the fetch threads, kept in step with the API quota.
+
+    The bucket starts full so short runs go at full speed. Every response
+    reports the quota through the X-RateLimit-Limit and X-RateLimit-Remaining
+    headers, and the bucket is never allowed to hold more tokens than the
+    server has left, less the requests still in flight. Once the reset time is
+    known (X-RateLimit-RetryAfter or Retry-After) the bucket refills at each
+    window boundary; until then it refills continuously at limit / window.
+    """
+
+    def __init__(self, limit: int = RATE_LIMIT, window: float = RATE_WINDOW):
+        self.limit = limit
+        self.window = window
+        self.tokens = float(limit)
+        self.updated = time.monotonic()
+        self.reset_at: Optional[float] = None
+        self.blocked_until = 0.0
+        self.pending = 0
+        self.waited = 0.0
+        self.throttled = 0
+        self.cond = threading.Condition()
+
+    def _refill(self, now: float) -> None:
+        if self.reset_at is not None:
+            if now >= self.reset_at:
+                self.tokens = float(self.limit - self.pending)
+                while self.reset_at <= now:
+                    self.reset_at += self.window
+        else:
+            rate = self.limit / self.window
+            self.tokens = min(self.limit, self.tokens + (now - self.updated) * rate)
+        self.updated = now
+
+    def acquire(self) -> float:
+        """
+        Wait until a request may be sent and take a token for it.
+
+        Returns:
+            Seconds spent waiting
+        """
+        started = None
+        with self.cond:
+            while True:
+                now = time.monotonic()
+                self._refill(now)
+                if now >= self.blocked_until and self.tokens >= 1:
+                    self.tokens -= 1
+                    self.pending += 1
+                    break
+                if now < self.blocked_until:
+                    wait = self.blocked_until - now
+                elif self.reset_at is not None:
+                    wait = self.reset_at - now
+                else:
+                    wait = (1 - self.tokens) * self.window / self.limit
+                if started is None:
+                    started = now
+                self.cond.wait(wait)
+            waited = now - started if started is not None else 0.0
+            self.waited += waited
+        return waited
+
+    def release(self) -> None:
+        """Finish a request that got no response."""
+        with self.cond:
+            self.pending -= 1
+            self.cond.notify_all()
+
+    def observe(self, status: int, headers: http.client.HTTPMessage) -> None:
+        """
+        Update the bucket from the rate-limit headers of a response.
+
+        Args:
+            status: HTTP status of the response
+            headers: Response headers
+        """
+        with self.cond:
+            now = time.monotonic()
+            self._refill(now)
+            self.pending -= 1
+
+            limit = headers.get("X-RateLimit-Limit")
+            if limit and limit.isdigit() and int(limit) > 0:
+                self.limit = int(limit)
+            retry_after = headers.get("X-RateLimit-RetryAfter") or headers.get(
+                "Retry-After"
+            )
+            if retry_after and retry_after.isdigit():
+                # Whole seconds only, so allow one more to be sure it has passed
+                self.reset_at = now + int(retry_after) + 1
+            remaining = headers.get("X-RateLimit-Remaining")
+            if remaining and remaining.lstrip("-").isdigit():
+                self.tokens = min(self.tokens, float(int(remaining) - self.pending))
+
+            if status == 429:
+                self.throttled += 1
+                delay = self.reset_at - now if self.reset_at else self.window
+                print(f"429 Hit. Sleeping {delay:.0f}s...")
+                self.tokens = min(self.tokens, 0.0)
+                self.blocked_until = max(self.blocked_until, now + delay)
+                if self.reset_at is None:
+                    self.reset_at = now + delay
+            self.cond.notify_all()
+
+
+class ConnectionPool:
+    """Thread-safe pool of persistent HTTP connections to a single host."""
+
+    def __init__(self, url: str, size: int = CONCURRENCY, timeout: float = 60):
+        parts = urlsplit(url)
+        self.scheme = parts.scheme
+        self.host = parts.netloc
+        self.timeout = timeout
+        self.idle: queue.LifoQueue = queue.LifoQueue(maxsize=size)
+
+    def _connect(self) -> http.client.HTTPConnection:
+        if self.scheme == "https":
+            return http.client.HTTPSConnection(self.host, timeout=self.timeout)
+        return http.client.HTTPConnection(self.host, timeout=self.timeout)
+
+    @contextmanager
+    def connection(self) -> Iterator[http.client.HTTPConnection]:
+        """Borrow a connection, returning it to the pool if it is still usable."""
+        try:
+            conn = self.idle.get_nowait()
+        except queue.Empty:
+            conn = self._connect()
+        try:
+            yield conn
+        except BaseException:
+            conn.close()
+            raise
+        try:
+            self.idle.put_nowait(conn)
+        except queue.Full:
+            conn.close()
+
+    def close(self) -> None:
+        """Close all idle connections."""
+        while True:
+            try:
+                self.idle.get_nowait().close()
+            except queue.Empty:
+                return
+
+
+def project_mod(mod: dict) -> dict:
+    """Keep only the fields stored in data.json for one API record."""
+    submitted_by = mod.get("submitted_by") or {}
+    modfile = mod.get("modfile") or {}
+    return {
+        "id": mod.get("id"),
+        "game_id": mod.get("game_id"),
+        "name": mod.get("name"),
+        "name_id": mod.get("name_id"),
+        "summary": mod.get("summary"),
+        "description": mod.get("description"),
+        "date_added": mod.get("date_added"),
+        "date_updated": mod.get("date_updated"),
+        "date_live": mod.get("date_live"),
+        "visible": mod.get("visible"),
+        "status": mod.get("status"),
+        "dependencies": mod.get("dependencies"),
+        "profile_url": mod.get("profile_url"),
+        "submitted_by": {
+            "id": submitted_by.get("id"),
+            "name_id": submitted_by.get("name_id"),
+            "username": submitted_by.get("username"),
+            "profile_url": submitted_by.get("profile_url"),
+            "profile_img_100x100_url": (submitted_by.get("avatar") or {}).get(
+                "thumb_100x100"
+            ),
+        },
+        "modfile": {
+            "id": modfile.get("id"),
+            "mod_id": modfile.get("mod_id"),
+            "version": modfile.get("version"),
+            "filename": modfile.get("filename"),
+            "changelog": modfile.get("changelog"),
+            "date_added": modfile.get("date_added"),
+            "date_updated": modfile.get("date_updated"),
+            "date_scanned": modfile.get("date_scanned"),
+            "filesize": modfile.get("filesize"),
+            "platforms": modfile.get("platforms"),
+        },
+        "logo": mod.get("logo"),
+        "tags": mod.get("tags"),
+        "platforms": mod.get("platforms"),
+    }
+
+
+class Scraper:
+    """Fetches pages of the mod list over a shared connection pool."""
+
+    def __init__(
+        self,
+        url: str,
+        api_key: str,
+        concurrency: int = CONCURRENCY,
+        cache: Optional[ResponseCache] = None,
+    ):
+        self.path = urlsplit(url).path or "/"
+        self.api_key = api_key
+        self.concurrency = concurrency
+        self.cache = cache
+        self.pool = ConnectionPool(url, size=concurrency)
+        self.limiter = RateLimiter()
+        self.lock = threading.Lock()
+        self.retries = 0
+        self.backoff_wait = 0.0
+
+    def backoff(self, attempt: int, reason: str) -> None:
+        """Sleep with full jitter before retry number attempt, or give up."""
+        if attempt > MAX_RETRIES:
+            raise RuntimeError(f"Giving up after {MAX_RETRIES} retries: {reason}")
+        delay = random.uniform(0, min(BACKOFF_MAX, BACKOFF_BASE * 2 ** (attempt - 1)))
+        print(f"{reason}. Retrying in {delay:.1f}s...")
+        with self.lock:
+            self.retries += 1
+            self.backoff_wait += delay
+        time.sleep(delay)
+
+    def fetch_page(
+        self, target: str, headers: Optional[dict[str, str]] = None
+    ) -> tuple[http.client.HTTPResponse, bytes]:
+        """
+        Fetch one page of mods, paced by the rate limiter.
+
+        Server errors and transport failures are retried with jittered
+        exponential backoff; a 429 is retried once the limiter allows.
+
+        Args:
+            target: Request path and query string
+            headers: Extra request headers, e.g. conditional request validators
+
+        Returns:
+            Tuple of (response, body) for a 2xx or 304 response
+        """
+        attempt = 0
+        stale = 0
+        while True:
+            self.limiter.acquire()
+            reused = False
+            try:
+                with self.pool.connection() as conn:
+                    reused = conn.sock is not None
+                    conn.request("GET", target, headers=headers or {})
+                    response = conn.getresponse()
+                    body = response.read()
+            except TRANSPORT_ERRORS as error:
+                self.limiter.release()
+                if reused and stale < self.concurrency:
+                    # A pooled keep-alive connection was closed by the server
+                    stale += 1
+                    continue
+                attempt += 1
+                self.backoff(attempt, f"{error!r} fetching {ResponseCache.key(target)}")
+                continue
+
+            self.limiter.observe(response.status, response.headers)
+            if response.status == 429:
+                continue
+            if response.status >= 500:
+                attempt += 1
+                self.backoff(
+                    attempt, f"Error {response.status} fetching {ResponseCache.key(target)}"
+                )
+                continue
+            if not (200 <= response.status < 300 or response.status == 304):
+                raise RuntimeError(
+                    f"Error {response.status} fetching {ResponseCache.key(target)}"
+                )
+
+            return response, body
+
+    def fetch_records(
+        self, offset: int, sort: str = FULL_SORT
+    ) -> tuple[list[dict], Optional[int]]:
+        """
+        Fetch one page and project its records straight away.
+
+        Runs on the fetch threads, so only the projected records outlive the
+        raw response. With a cache the request is made conditional, and a 304
+        or a body identical to the cached one is answered from the cache.
+
+        Args:
+            offset: Index of the first mod on the page
+            sort: Value of the _sort parameter
+
+        Returns:
+            Tuple of (projected records, total number of mods if reported)
+        """
+        params = {
+            "api_key": self.api_key,
+            "_limit": PAGE_LIMIT,
+            "_offset": offset,
+            "_sort": sort,
+            **QUERY,
+        }
+        target = f"{self.path}?{urlencode(params)}"
+        if self.cache is None:
+            _, body = self.fetch_page(target)
+            page = json.loads(body)
+            records = [project_mod(record) for record in page.get("data") or []]
+            return records, page.get("result_total")
+
+        key = ResponseCache.key(target)
+        cached = self.cache.get(key)
+        headers = {}
+        if cached is not None and cached.etag:
+            headers["If-None-Match"] = cached.etag
+        if cached is not None and cached.last_modified:
+            headers["If-Modified-Since"] = cached.last_modified
+
+        response, body = self.fetch_page(target, headers)
+        digest = hashlib.sha256(body).hexdigest()
+        if cached is not None and (response.status == 304 or cached.digest == digest):
+            return self.cache.load(key, cached), cached.total
+
+        page = json.loads(body)
+        records = [project_mod(record) for record in page.get("data") or []]
+        entry = CachedPage(
+            etag=response.getheader("ETag"),
+            last_modified=response.getheader("Last-Modified"),
+            digest=digest,
+            total=page.get("result_total"),
+        )
+        self.cache.put(key, entry, records)
+        return records, entry.total
+
+    def scrape(
+        self, watermark: Optional[int] = None
+    ) -> tuple[dict[Any, dict], ScrapeStats]:
+        """
+        Fetch pages, projecting each record as its page arrives.
+
+        Without a watermark every page is fetched, sorted by ID: the first
+        page reports the total number of mods and the remaining pages are
+        then requested concurrently, at most twice the concurrency ahead, and
+        handled in offset order. With a watermark pages are walked newest
+        first and pagination stops after the first page whose records are
+        all older than it.
+
+        Args:
+            watermark: Highest date_updated already stored, for a delta scrape
+
+        Returns:
+            Tuple of (projected mods by ID, run counters)
+        """
+        stats = ScrapeStats(mode="full" if watermark is None else "delta")
+        started = time.monotonic()
+        mods: dict[Any, dict] = {}
+
+        def collect(offset: int, records: list[dict]) -> list[dict]:
+            print(f"Fetched offset={offset}: {len(records)} items")
+            stats.pages += 1
+            stats.records += len(records)
+            for record in records:
+                # Keep the first record seen for an ID, like unique_by(.id)
+                mods.setdefault(record[ID_FIELD], record)
+            return records
+
+        sort = FULL_SORT if watermark is None else DELTA_SORT
+        records, total = self.fetch_records(0, sort)
+        collect(0, records)
+
+        if watermark is not None:
+            offset = 0
+            while len(records) == PAGE_LIMIT and any(
+                (record.get("date_updated") or 0) >= watermark for record in records
+            ):
+                offset += PAGE_LIMIT
+                records = collect(offset, self.fetch_records(offset, sort)[0])
+        elif total is None:
+            # No total reported: walk pages one at a time until a short page
+            offset = 0
+            while len(records) == PAGE_LIMIT:
+                offset += PAGE_LIMIT
+                records = collect(offset, self.fetch_records(offset, sort)[0])
+        else:
+            offsets = range(PAGE_LIMIT, total, PAGE_LIMIT)
+            with ThreadPoolExecutor(max_workers=self.concurrency) as executor:
+                window: deque = deque()
+                for offset in offsets:
+                    window.append((offset, executor.submit(self.fetch_records, offset, sort)))
+                    if len(window) >= self.concurrency * 2:
+                        offset, future = window.popleft()
+                        collect(offset, future.result()[0])
+                while window:
+                    offset, future = window.popleft()
+                    collect(offset, future.result()[0])
+
+        self.pool.close()
+        stats.mods = len(mods)
+        stats.seconds = time.monotonic() - started
+        stats.retries = self.retries
+        stats.throttled = self.limiter.throttled
+        stats.rate_wait = self.limiter.waited
+        stats.backoff_wait = self.backoff_wait
+        if self.cache is not None:
+            self.cache.save()
+            stats.cache_hits = self.cache.hits
+            stats.cache_misses = self.cache.misses
+        return mods, stats
+
+
+def _canonical(value: Any) -> Any:
+    """Copy a JSON value with the keys of every object in sorted order."""
+    if isinstance(value, dict):
+        return {key: _canonical(value[key]) for key in sorted(value)}
+    if isinstance(value, list):
+        return [_canonical(element) for element in value]
+    return value
+
+
+def _sorted_array(value: Any) -> Any:
+    """Sort a list of JSON values by their serialized form; leave anything else."""
+    if not isinstance(value, list):
+        return value
+    return sorted(value, key=lambda element: json.dumps(element, sort_keys=True))
+
+
+def canonical_mod(mod: dict) -> dict:
+    """
+    Normalize a projected mod so equal content always serializes identically.
+
+    The ID comes first and every other key is sorted, at every level. The
+    arrays whose order the API does not guarantee (SORTED_ARRAYS and the
+    modfile's platforms) are sorted too.
+
+    Args:
+        mod: Projected mod record
+
+    Returns:
+        Canonical copy of the record
+    """
+    record = {ID_FIELD: mod.get(ID_FIELD)}
+    for key in sorted(mod):
+        if key != ID_FIELD:
+            value = _canonical(mod[key])
+            record[key] = _sorted_array(value) if key in SORTED_ARRAYS else value
+    modfile = record.get("modfile")
+    if isinstance(modfile, dict) and "platforms" in modfile:
+        modfile["platforms"] = _sorted_array(modfile["platforms"])
+    return record
+
+
+def record_line(mod: dict) -> str:
+    """Serialize a mod as one compact canonical JSON line, without the newline."""
+    return json.dumps(canonical_mod(mod), ensure_ascii=False, separators=(",", ":"))
+
+
+def write_data(mods: dict[Any, dict], output_path: str) -> None:
+    """
+    Write mods sorted by ID as a JSON array with one canonical record per line.
+
+    An unchanged mod produces a byte-identical line from one scrape to the
+    next, which keeps git deltas small and lets the ingester skip unchanged
+    records without parsing them (see ``ingest.split_records``).
+
+    Args:
+        mods: Projected mods by ID
+        output_path: Path of the JSON file to write
+    """
+    records = sorted(mods.values(), key=lambda mod: mod[ID_FIELD])
+    with open(output_path, "w", encoding="utf-8") as f:
+        f.write("[\n")
+        for index, mod in enumerate(records):
+            f.write(record_line(mod))
+            f.write(",\n" if index < len(records) - 1 else "\n")
+        f.write("]\n")
+
+
+def load_data(path: str) -> dict[Any, dict]:
+    """Load an existing data.json keyed by mod ID."""
+    with open(path, encoding="utf-8") as f:
+        return {mod[ID_FIELD]: mod for mod in json.load(f)}
+
+
+def predates_query(mods: dict[Any, dict]) -> bool:
+    """Check whether stored mods were all scraped with only ORIGINAL_PLATFORM."""
+    return all(
+        any(
+            platform.get("platform") == ORIGINAL_PLATFORM
+            for platform in mod.get("platforms") or []
+        )
+        for mod in mods.values()
+    )
+
+
+def shard_path(mod_id: int) -> str:
+    """Path of a mod's file relative to the store directory."""
+    return f"mods/{mod_id % SHARD_COUNT}/{mod_id}.json"
+
+
+def record_digest(line: str) -> str:
+    """Manifest hash of a record line."""
+    return hashlib.sha1(line.encode("utf-8")).hexdigest()
+
+
+def manifest_text(manifest: dict[str, str]) -> str:
+    """Serialize a store manifest ({mod ID: record hash}) one entry per line."""
+    return json.dumps(manifest, indent=0) + "\n"
+
+
+def write_store(mods: dict[Any, dict], directory: str) -> int:
+    """
+    Write mods as a sharded store: one file per mod plus a manifest.
+
+    Each file holds the mod's canonical record line and lives at
+    ``shard_path(id)``. The manifest maps every mod ID to the hash of its
+    line, so files whose hash is unchanged are left alone; files of mods no
+    longer present are deleted.
+
+    Args:
+        mods: Projected mods by ID
+        directory: Store directory
+
+    Returns:
+        Number of mod files written or deleted
+    """
+    manifest_path = os.path.join(directory, STORE_MANIFEST)
+    try:
+        with open(manifest_path, encoding="utf-8") as f:
+            previous = json.load(f)
+    except FileNotFoundError:
+        previous = {}
+
+    manifest: dict[str, str] = {}
+    changed = 0
+    for mod in sorted(mods.values(), key=lambda mod: mod[ID_FIELD]):
+        line = record_line(mod)
+        key = str(mod[ID_FIELD])
+        manifest[key] = record_digest(line)
+        path = os.path.join(directory, shard_path(mod[ID_FIELD]))
+        if previous.get(key) == manifest[key] and os.path.exists(path):
+            continue
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(line + "\n")
+        changed += 1
+
+    for key in previous.keys() - manifest.keys():
+        try:
+            os.remove(os.path.join(directory, shard_path(int(key))))
+        except FileNotFoundError:
+            pass
+        changed += 1
+
+    with open(manifest_path, "w", encoding="utf-8") as f:
+        f.write(manifest_text(manifest))
+    return changed
+
+
+def load_store(directory: str) -> dict[Any, dict]:
+    """Load the mods listed in a sharded store's manifest, keyed by mod ID."""
+    with open(os.path.join(directory, STORE_MANIFEST), encoding="utf-8") as f:
+        manifest = json.load(f)
+    mods = {}
+    for key in manifest:
+        with open(os.path.join(directory, shard_path(int(key))), encoding="utf-8") as f:
+            mods[int(key)] = json.load(f)
+    return mods
+
+
+def scrape(
+    url: str,
+    api_key: str,
+    output_path: str = "data.json",
+    concurrency: int = CONCURRENCY,
+    full: bool = True,
+    cache_dir: Optional[str] = None,
+    sharded: bool = False,
+) -> ScrapeStats:
+    """
+    Scrape mods and write them to output_path.
+
+    A delta scrape (full=False) only fetches mods updated since the highest
+    date_updated in the existing output and merges them in by ID. Mods that
+    were removed from mod.io are only dropped by a full scrape. Output from
+    before QUERY was widened (see ``predates_query``) always gets a full
+    scrape.
+
+    Args:
+        url: mod.io endpoint listing the game's mods
+        api_key: mod.io API key
+        output_path: Path of the JSON file to write
+        concurrency: Maximum number of requests in flight
+        full: Fetch every page instead of only the changed ones
+        cache_dir: Directory of the page cache, or None to always download
+        sharded: Treat output_path as a sharded store directory (see
+            write_store) instead of a single JSON file
+
+    Returns:
+        Counters for the pages and mods fetched
+    """
+    cache = ResponseCache(cache_dir) if cache_dir else None
+    scraper = Scraper(url, api_key, concurrency, cache)
+    existing = os.path.join(output_path, STORE_MANIFEST) if sharded else output_path
+    mods = None
+    if not full and os.path.exists(existing):
+        mods = load_store(output_path) if sharded else load_data(output_path)
+        if predates_query(mods):
+            print(f"Stored mods are all {ORIGINAL_PLATFORM} mods, doing a full sweep")
+            mods = None
+    if mods is None:
+        mods, stats = scraper.scrape()
+    else:
+        watermark = max((mod.get("date_updated") or 0 for mod in mods.values()), default=0)
+        changed, stats = scraper.scrape(watermark)
+        mods.update(changed)
+        stats.mods = len(changed)
+    if sharded:
+        stats.files_changed = write_store(mods, output_path)
+    else:
+        write_data(mods, output_path)
+    return stats
+
+
+def main(argv: Optional[list[str]] = None):
+    """CLI entry point."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("output", nargs="?", default="data.json")
+    parser.add_argument(
+        "--full", action="store_true", help="fetch every page instead of a delta"
+    )
+    parser.add_argument(
+        "--cache", default=CACHE_DIR, help="page cache directory (default: %(default)s)"
+    )
+    parser.add_argument(
+        "--no-cache",
+        dest="cache",
+        action="store_const",
+        const=None,
+        help="always download every page",
+    )
+    parser.add_argument(
+        "--sharded",
+        action="store_true",
+        help="write OUTPUT as a store directory with one file per mod",
+    )
+    args = parser.parse_args(argv)
+
+    url = os.environ.get("URL_TO_SCRAPE")
+    api_key = os.environ.get("API_KEY")
+    if not url or not api_key:
+        print("Secrets missing!")
+        sys.exit(1)
+
+    full = args.full or datetime.now(timezone.utc).hour == FULL_SWEEP_HOUR
+    stats = scrape(
+        url, api_key, args.output, full=full, cache_dir=args.cache, sharded=args.sharded
+    )
+    if args.sharded:
+        written = f"{args.output}: {stats.files_changed} file(s) changed"
+    else:
+        written = f"{args.output} size: {os.path.getsize(args.output) / 1024:.0f}K"
+    print(
+        f"Finished {stats.mode} scrape. {stats.mods} mods from {stats.pages} pages "
+        f"in {stats.seconds:.1f}s, {written}"
+    )
+    if stats.rate_wait or stats.retries or stats.throttled:
+        print(
+            f"Requests waited {stats.rate_wait:.1f}s for the rate limit, "
+            f"{stats.backoff_wait:.1f}s backing off ({stats.retries} retries, "
+            f"{stats.throttled} 429s)"
+        )
+    if args.cache:
+        print(f"Page cache: {stats.cache_hits} hits, {stats.cache_misses} misses")
+
+
+if __name__ == "__main__":
+    main()
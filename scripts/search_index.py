@@ -0,0 +1,90 @@
+"""Build the search index the page queries in the browser."""
+
+import re
+from datetime import datetime, timezone
+from typing import Iterable
+
+from .changelog_data import Mod
+
+# Letters and digits; the page's search script splits queries the same way.
+# Every token is kept, however short, or a query that contains one (the "5"
+# in "Mod 5", the "s" in "Karlach's") could never match the text it came from.
+TOKEN_RE = re.compile(r"[^\W_]+")
+
+
+def tokenize(text: str) -> list[str]:
+    """Split text into lowercase search tokens."""
+    return TOKEN_RE.findall(text.lower())
+
+
+class SearchIndexBuilder:
+    """
+    Inverted index over mod names and summaries, built one mod at a time.
+
+    Only a compact row per mod is kept, so mods can be added straight
+    from ``iter_mods`` while other consumers read the same stream.
+    """
+
+    def __init__(self):
+        # (last event epoch, item_id, name, profile URL, last event date,
+        # last event type, tokens) per mod
+        self.rows: list[tuple] = []
+
+    def __len__(self) -> int:
+        return len(self.rows)
+
+    def add(self, mod: Mod) -> None:
+        """Record a mod's search row and tokens."""
+        last = max(mod.updates, key=lambda update: update.epoch, default=None)
+        self.rows.append(
+            (
+                last.epoch if last else 0,
+                mod.item_id,
+                mod.name,
+                mod.profile_url,
+                datetime.fromtimestamp(last.epoch, timezone.utc).date().isoformat()
+                if last
+                else None,
+                last.update_type if last else None,
+                tuple(dict.fromkeys(tokenize(f"{mod.name} {mod.summary or ''}"))),
+            )
+        )
+
+    def build(self) -> dict:
+        """
+        Build the index from the mods added so far.
+
+        Mods are listed by their latest event, newest first, and every token
+        maps to positions in that list. Intersecting the posting lists of a
+        query's tokens therefore yields the matches already sorted by recency.
+
+        Returns:
+            Dict with "mods" ([id, name, profile URL, last event date, last
+            event type] rows), "tokens" (sorted) and "postings" (one sorted
+            list of mod positions per token)
+        """
+        rows = sorted(self.rows, key=lambda row: (-row[0], row[1]))
+        postings: dict[str, list[int]] = {}
+        for position, row in enumerate(rows):
+            for token in row[6]:
+                postings.setdefault(token, []).append(position)
+
+        tokens = sorted(postings)
+        return {
+            "mods": [list(row[1:6]) for row in rows],
+            "tokens": tokens,
+            "postings": [postings[token] for token in tokens],
+        }
+
+
+def build_search_index(mods: Iterable[Mod]) -> dict:
+    """
+    Build the search index for mods; see ``SearchIndexBuilder.build``.
+
+    Args:
+        mods: Mods with their updates
+    """
+    builder = SearchIndexBuilder()
+    for mod in mods:
+        builder.add(mod)
+    return builder.build()
@@ -0,0 +1,19 @@
+import pytest
+
+from .modio_server import ModioServer, make_mod
+
+BOTH = ("xboxseriesx", "ps5")
+XBOX_ONLY = ("xboxseriesx",)
+
+
+@pytest.fixture
+def modio():
+    """A stand-in mod.io server holding 250 mods, every tenth one only on Xbox."""
+    server = ModioServer(
+        [
+            make_mod(mod_id, platforms=XBOX_ONLY if mod_id % 10 == 0 else BOTH)
+            for mod_id in range(1, 251)
+        ]
+    ).start()
+    yield server
+    server.stop()
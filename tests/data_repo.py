@@ -0,0 +1,91 @@
+"""Git repositories of data.json snapshots, for testing the ingester."""
+
+import json
+import os
+import subprocess
+from typing import Optional
+
+from scripts.scrape import write_data, write_store
+
+# Commit time of the first snapshot; each later one is an hour after the last
+FIRST_COMMIT_AT = 1764000000
+
+
+def snapshot_mod(
+    mod_id: int,
+    ps5: Optional[int] = 1,
+    xbox: Optional[int] = None,
+    date_added: Optional[int] = None,
+    **fields,
+) -> dict:
+    """A data.json record live on the given platforms at the given modfile_live."""
+    platforms = [
+        {"platform": name, "modfile_live": live}
+        for name, live in (("ps5", ps5), ("xboxseriesx", xbox))
+        if live is not None
+    ]
+    return {
+        "id": mod_id,
+        "name": f"Mod {mod_id}",
+        "summary": f"Summary of mod {mod_id}",
+        "date_added": FIRST_COMMIT_AT - 86400 if date_added is None else date_added,
+        "date_updated": FIRST_COMMIT_AT - 86400,
+        "profile_url": f"https://mod.io/g/baldursgate3/m/mod-{mod_id}",
+        "logo": {"original": f"https://img/{mod_id}.png"},
+        "platforms": platforms,
+        **fields,
+    }
+
+
+class DataRepo:
+    """
+    A git repository that commits one data snapshot per ``commit`` call.
+
+    Snapshots can be written as one record per line (``scrape.write_data``),
+    as the pretty-printed array the scrape used to write, or as a sharded
+    store (``scrape.write_store``). Commit times are an hour apart, so runs
+    over the same snapshots produce the same rows.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self.count = 0
+        os.makedirs(path, exist_ok=True)
+        self.git("init", "-q", "-b", "main")
+        self.git("config", "user.name", "Test")
+        self.git("config", "user.email", "test@example.com")
+
+    def git(self, *args: str) -> str:
+        timestamp = f"{FIRST_COMMIT_AT + self.count * 3600} +0000"
+        env = {**os.environ, "GIT_AUTHOR_DATE": timestamp, "GIT_COMMITTER_DATE": timestamp}
+        result = subprocess.run(
+            ["git", *args], cwd=self.path, env=env, capture_output=True, text=True, check=True
+        )
+        return result.stdout.strip()
+
+    def commit(self, mods: list[dict], layout: str = "lines", data_path: str = "data.json") -> str:
+        """
+        Write mods as the next snapshot and commit it.
+
+        Args:
+            mods: Records in file order; "pretty" keeps repeated IDs
+            layout: "lines", "pretty" or "store"
+            data_path: File, or directory for "store", inside the repository
+
+        Returns:
+            Hash of the new commit
+        """
+        path = os.path.join(self.path, data_path)
+        if layout == "lines":
+            write_data({mod["id"]: mod for mod in mods}, path)
+        elif layout == "pretty":
+            with open(path, "w", encoding="utf-8") as f:
+                json.dump(mods, f, indent=2)
+        elif layout == "store":
+            write_store({mod["id"]: mod for mod in mods}, path)
+        else:
+            raise ValueError(f"Unknown layout {layout!r}")
+        self.git("add", "-A", data_path)
+        self.git("commit", "-q", "-m", f"Snapshot {self.count}")
+        self.count += 1
+        return self.git("rev-parse", "HEAD")
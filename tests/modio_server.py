@@ -0,0 +1,174 @@
+"""Local stand-in for the mod.io mods endpoint, for testing the scraper."""
+
+import hashlib
+import json
+import threading
+from collections import deque
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Callable, Optional
+from urllib.parse import parse_qsl, urlsplit
+
+MODS_PATH = "/v1/games/6715/mods"
+
+
+def make_mod(
+    mod_id: int,
+    date_updated: Optional[int] = None,
+    platforms: tuple[str, ...] = ("xboxseriesx", "ps5"),
+) -> dict:
+    """An API record with the fields the scraper projects, plus some it drops."""
+    return {
+        "id": mod_id,
+        "game_id": 6715,
+        "name": f"Mod {mod_id}",
+        "name_id": f"mod-{mod_id}",
+        "summary": f"Summary of mod {mod_id}",
+        "description": "Long description",
+        "date_added": 1764000000 + mod_id,
+        "date_updated": 1764000000 + mod_id if date_updated is None else date_updated,
+        "date_live": 1764000000 + mod_id,
+        "visible": 1,
+        "status": 1,
+        "dependencies": False,
+        "profile_url": f"https://mod.io/g/baldursgate3/m/mod-{mod_id}",
+        "submitted_by": {
+            "id": 1,
+            "name_id": "author",
+            "username": "Author",
+            "profile_url": "https://mod.io/u/author",
+            "avatar": {"thumb_100x100": "https://img/avatar.png"},
+        },
+        "modfile": {
+            "id": mod_id * 10,
+            "mod_id": mod_id,
+            "version": "1.0",
+            "filename": "mod.zip",
+            "changelog": None,
+            "date_added": 1,
+            "date_updated": 1,
+            "date_scanned": 1,
+            "filesize": 100,
+            "platforms": [{"platform": "ps5", "status": 1}],
+            "download": {"binary_url": "https://dl/mod.zip"},
+        },
+        "logo": {"original": f"https://img/{mod_id}.png"},
+        "media": {"images": []},
+        "tags": [{"name": "Gameplay"}, {"name": "Balance"}],
+        "platforms": [{"platform": platform, "modfile_live": mod_id} for platform in platforms],
+    }
+
+
+class ModioServer:
+    """
+    Serves paged mod lists the way the mod.io API does, on a local port.
+
+    Pages honour ``_offset``, ``_limit`` and ``_sort`` (``id`` or
+    ``-date_updated``). Responses queued in ``responses`` are sent instead
+    of a page, one per request, to simulate throttling and server errors.
+    Pages carry an ETag and a Last-Modified header, and a request that
+    repeats the page's current validator is answered with a 304.
+    """
+
+    def __init__(self, mods: list[dict]):
+        self.mods = mods
+        self.report_total = True
+        # (status, headers) sent instead of the next pages
+        self.responses: deque[tuple[int, dict[str, str]]] = deque()
+        # Extra headers on every page, e.g. rate-limit headers
+        self.headers: dict[str, str] = {}
+        # Called with the request number before each page is built
+        self.on_request: Optional[Callable[[int], None]] = None
+        # Validators sent with every page; change last_modified with the mods
+        # when ETags are off, and clear conditional to always send the page
+        self.etags = True
+        self.last_modified: Optional[str] = "Thu, 01 Jan 2026 00:00:00 GMT"
+        self.conditional = True
+        self.requests: list[dict[str, str]] = []
+        self.not_modified = 0
+        self.lock = threading.Lock()
+        self.httpd = ThreadingHTTPServer(("127.0.0.1", 0), self._handler())
+        self.httpd.daemon_threads = True
+        self.thread = threading.Thread(
+            target=self.httpd.serve_forever, kwargs={"poll_interval": 0.05}, daemon=True
+        )
+
+    @property
+    def url(self) -> str:
+        host, port = self.httpd.server_address[:2]
+        return f"http://{host}:{port}{MODS_PATH}"
+
+    def start(self) -> "ModioServer":
+        self.thread.start()
+        return self
+
+    def stop(self) -> None:
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+    def page(self, query: dict[str, str]) -> dict:
+        """Build the response body for one page request."""
+        with self.lock:
+            if self.on_request is not None:
+                self.on_request(len(self.requests))
+            if query.get("_sort") == "-date_updated":
+                ordered = sorted(self.mods, key=lambda mod: -mod["date_updated"])
+            else:
+                ordered = sorted(self.mods, key=lambda mod: mod["id"])
+        offset = int(query.get("_offset", 0))
+        limit = int(query.get("_limit", 100))
+        data = ordered[offset : offset + limit]
+        body = {
+            "data": data,
+            "result_count": len(data),
+            "result_offset": offset,
+            "result_limit": limit,
+        }
+        if self.report_total:
+            body["result_total"] = len(ordered)
+        return body
+
+    def _handler(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def log_message(self, *args):
+                pass
+
+            def do_GET(self):
+                query = dict(parse_qsl(urlsplit(self.path).query))
+                with server.lock:
+                    server.requests.append(query)
+                    scripted = server.responses.popleft() if server.responses else None
+                if scripted is not None:
+                    status, headers = scripted
+                    body = b'{"error":{}}'
+                else:
+                    body = json.dumps(server.page(query)).encode("utf-8")
+                    status, headers = 200, dict(server.headers)
+                    if server.etags:
+                        headers["ETag"] = f'"{hashlib.sha1(body).hexdigest()}"'
+                    if server.last_modified:
+                        headers["Last-Modified"] = server.last_modified
+                    if server.conditional and self.unchanged(headers):
+                        status, body = 304, b""
+                        with server.lock:
+                            server.not_modified += 1
+                self.send_response(status)
+                for name, value in headers.items():
+                    self.send_header(name, value)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def unchanged(self, headers: dict[str, str]) -> bool:
+                # If-None-Match takes precedence over If-Modified-Since
+                etag = self.headers.get("If-None-Match")
+                if etag is not None:
+                    return etag == headers.get("ETag")
+                since = self.headers.get("If-Modified-Since")
+                return since is not None and since == headers.get("Last-Modified")
+
+        return Handler
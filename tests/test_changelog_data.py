@@ -0,0 +1,29 @@
+from scripts.changelog_data import iter_mods
+from scripts.ingest import ingest
+from scripts.search_index import build_search_index
+
+from .data_repo import DataRepo, snapshot_mod
+
+
+def test_mods_seeded_without_events_are_still_listed(tmp_path):
+    repo = DataRepo(str(tmp_path / "repo"))
+    repo.commit([snapshot_mod(1), snapshot_mod(2)])
+    # The platform cutover: mods 3 and 4 were on Xbox all along
+    repo.commit([snapshot_mod(mod_id, ps5=None if mod_id > 2 else 1, xbox=1) for mod_id in range(1, 5)])
+    db_path = str(tmp_path / "mods.db")
+    stats = ingest(db_path, repo_path=repo.path, workers=1)
+
+    mods = list(iter_mods(db_path))
+    index = build_search_index(mods)
+
+    assert stats.items_backfilled == 2
+    assert [(mod.name, len(mod.updates)) for mod in mods] == [
+        ("Mod 1", 2),
+        ("Mod 2", 2),
+        ("Mod 3", 0),
+        ("Mod 4", 0),
+    ]
+    # Seeded mods are searchable, after every mod with an event
+    assert [row[1] for row in index["mods"]] == ["Mod 1", "Mod 2", "Mod 3", "Mod 4"]
+    assert index["mods"][2][3:] == [None, None]
+    assert index["postings"][index["tokens"].index("3")] == [2]
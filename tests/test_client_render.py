@@ -0,0 +1,52 @@
+import html
+import json
+import re
+import shutil
+import subprocess
+
+import pytest
+
+from scripts.components import mod_card
+from scripts.components.client_render import client_render_script
+
+FEED_MODS = [
+    {"name": "Mod 1", "summary": "Plain", "logo": "https://img/1.png", "url": "https://mod/1"},
+    {"name": "Karlach's <Armour>", "summary": 'A "quoted" & co', "logo": None, "url": None},
+    {"name": "Mod 3", "summary": "", "logo": None, "url": "https://mod/3?a=1&b=2"},
+]
+
+pytestmark = pytest.mark.skipif(shutil.which("node") is None, reason="needs node")
+
+
+def numeric_references(markup: str) -> str:
+    """Spell every character reference as a decimal one, e.g. &quot; as &#34;."""
+    return re.sub(r"&#?\w+;", lambda match: f"&#{ord(html.unescape(match[0]))};", markup)
+
+
+def render_cards(rows: list[tuple[dict, str]]) -> list[str]:
+    """Run the page's renderModCard in node for each (feed mod, platforms) row."""
+    script = client_render_script().strip().removeprefix("<script>").removesuffix("</script>")
+    program = f"""
+        globalThis.document = {{ addEventListener() {{}} }};
+        {script}
+        const rows = {json.dumps(rows)};
+        console.log(JSON.stringify(rows.map(([mod, platforms]) => renderModCard(mod, platforms))));
+    """
+    result = subprocess.run(
+        ["node", "-"], input=program, capture_output=True, text=True, check=True
+    )
+    return json.loads(result.stdout)
+
+
+@pytest.mark.parametrize("platforms", [("ps5",), ("ps5", "xboxseriesx")])
+def test_client_cards_match_server_cards(platforms):
+    rows = [(mod, " ".join(platforms)) for mod in FEED_MODS]
+
+    cards = render_cards(rows)
+
+    for mod, card in zip(FEED_MODS, cards):
+        expected = mod_card(
+            mod["name"], mod["summary"], mod["logo"], mod["url"], platforms=platforms
+        )
+        # Both escape the same characters, as named or numeric references
+        assert numeric_references(card) == numeric_references(expected)
@@ -0,0 +1,297 @@
+import json
+import sqlite3
+
+import pytest
+
+from scripts import ingest as ingest_module
+from scripts import scrape
+from scripts.ingest import ingest
+from scripts.scrape import canonical_mod
+
+from .data_repo import FIRST_COMMIT_AT, DataRepo, snapshot_mod
+from .modio_server import ModioServer, make_mod
+
+
+@pytest.fixture
+def repo(tmp_path):
+    return DataRepo(str(tmp_path / "repo"))
+
+
+def run(repo: DataRepo, db_path, **kwargs):
+    kwargs.setdefault("workers", 1)
+    return ingest(str(db_path), repo_path=repo.path, **kwargs)
+
+
+def dump(db_path) -> dict:
+    """The ingested rows, keyed by commit time rather than hash or row ID."""
+    connection = sqlite3.connect(db_path)
+    try:
+        return {
+            "commits": connection.execute(
+                "SELECT commit_at FROM commits ORDER BY id"
+            ).fetchall(),
+            "items": connection.execute(
+                "SELECT id, name, _item_full_hash FROM item ORDER BY id"
+            ).fetchall(),
+            "versions": [
+                (commit_at, mod_id, version, full_hash, sorted(json.loads(changed)))
+                for commit_at, mod_id, version, full_hash, changed in connection.execute(
+                    """
+                    SELECT item_version_detail._commit_at, item.id,
+                        item_version_detail._version, item_version_detail._item_full_hash,
+                        item_version_detail._changed_columns
+                    FROM item_version_detail
+                    JOIN item ON item._id = item_version_detail._item
+                    ORDER BY item.id, item_version_detail._version
+                    """
+                )
+            ],
+            "events": connection.execute(
+                """
+                SELECT item.id, mod_events.ts, mod_events.kind, mod_events.platform,
+                    mod_events.modfile_live, mod_events.version
+                FROM mod_events
+                JOIN item ON item._id = mod_events.item_id
+                ORDER BY item.id, mod_events.version, mod_events.rowid
+                """
+            ).fetchall(),
+        }
+    finally:
+        connection.close()
+
+
+def history(count: int) -> list[list[dict]]:
+    """Snapshots where mods are added, updated on either platform and removed."""
+    snapshots = []
+    for n in range(count):
+        snapshots.append(
+            [
+                snapshot_mod(
+                    mod_id,
+                    ps5=1 + (n + mod_id) // 3,
+                    xbox=1 + n // 4 if mod_id % 2 else None,
+                    name=f"Mod {mod_id} rev {(n + mod_id) // 5}",
+                )
+                for mod_id in range(1, 4 + n % 7)
+                if (mod_id + n) % 11
+            ]
+        )
+    return snapshots
+
+
+def test_versions_changes_and_events(repo, tmp_path):
+    repo.commit([snapshot_mod(1), snapshot_mod(2)])
+    repo.commit([snapshot_mod(1, ps5=2, name="Renamed"), snapshot_mod(2), snapshot_mod(3, xbox=1)])
+    db_path = tmp_path / "mods.db"
+
+    stats = run(repo, db_path)
+
+    assert (stats.commits, stats.items_added, stats.items_updated) == (2, 3, 1)
+    rows = dump(db_path)
+    first, second = [commit_at for (commit_at,) in rows["commits"]]
+    changed = [(mod_id, version, columns) for _, mod_id, version, _, columns in rows["versions"]]
+    assert changed[1] == (1, 2, ["name", "platforms"])
+    assert [(mod_id, version) for mod_id, version, _ in changed] == [(1, 1), (1, 2), (2, 1), (3, 1)]
+    assert rows["events"] == [
+        (1, first, "added", "ps5", 1, 1),
+        (1, second, "updated", "ps5", 2, 2),
+        (2, first, "added", "ps5", 1, 1),
+        (3, second, "added", "ps5", 1, 1),
+        (3, second, "added", "xboxseriesx", 1, 1),
+    ]
+
+
+def test_resume_from_checkpoint_matches_a_single_run(repo, tmp_path):
+    snapshots = history(12)
+    for snapshot in snapshots[:7]:
+        repo.commit(snapshot)
+    resumed = tmp_path / "resumed.db"
+    run(repo, resumed)
+    for snapshot in snapshots[7:]:
+        repo.commit(snapshot)
+
+    stats = run(repo, resumed)
+
+    assert stats.commits == 5
+    run(repo, tmp_path / "fresh.db")
+    assert dump(resumed) == dump(tmp_path / "fresh.db")
+
+
+def test_unreachable_checkpoint_rebuilds(repo, tmp_path, capsys):
+    snapshots = history(6)
+    first = repo.commit(snapshots[0])
+    for snapshot in snapshots[1:4]:
+        repo.commit(snapshot)
+    db_path = tmp_path / "mods.db"
+    run(repo, db_path)
+    # Rewrite history so the checkpoint is no longer on the branch
+    repo.git("reset", "-q", "--hard", first)
+    for snapshot in snapshots[4:]:
+        repo.commit(snapshot)
+
+    stats = run(repo, db_path)
+
+    assert "is not in the current history, rebuilding" in capsys.readouterr().out
+    assert stats.commits == 3
+    run(repo, tmp_path / "fresh.db")
+    assert dump(db_path) == dump(tmp_path / "fresh.db")
+
+
+def duplicate_history(repo: DataRepo) -> None:
+    repo.commit([snapshot_mod(1), snapshot_mod(2)], layout="pretty")
+    repo.commit(
+        [
+            snapshot_mod(1, ps5=2, name="Newer", date_updated=20),
+            snapshot_mod(2, ps5=2),
+            snapshot_mod(1, ps5=3, name="Older", date_updated=10),
+        ],
+        layout="pretty",
+    )
+    repo.commit([snapshot_mod(1, ps5=2, name="Newer", date_updated=20), snapshot_mod(2, ps5=3)])
+
+
+def test_duplicates_are_deduped(repo, tmp_path):
+    duplicate_history(repo)
+    db_path = tmp_path / "mods.db"
+
+    stats = run(repo, db_path, on_duplicate="dedupe")
+
+    assert (stats.duplicate_commits, stats.duplicate_items, stats.skipped_commits) == (1, 1, 0)
+    rows = dump(db_path)
+    assert [name for _, name, _ in rows["items"]] == ["Newer", "Mod 2"]
+    assert [(mod_id, version) for _, mod_id, version, _, _ in rows["versions"]] == [
+        (1, 1),
+        (1, 2),
+        (2, 1),
+        (2, 2),
+        (2, 3),
+    ]
+
+
+def test_duplicates_skip_the_commit(repo, tmp_path):
+    duplicate_history(repo)
+    db_path = tmp_path / "mods.db"
+
+    stats = run(repo, db_path, on_duplicate="skip")
+
+    assert (stats.skipped_commits, stats.commits) == (1, 2)
+    rows = dump(db_path)
+    assert len(rows["commits"]) == 2
+    # The skipped snapshot's changes arrive with the next one instead
+    assert [(mod_id, version) for _, mod_id, version, _, _ in rows["versions"]] == [
+        (1, 1),
+        (1, 2),
+        (2, 1),
+        (2, 2),
+    ]
+
+
+def test_invalid_duplicate_mode_is_rejected(tmp_path):
+    with pytest.raises(ValueError):
+        ingest_module.Ingester(sqlite3.connect(tmp_path / "mods.db"), on_duplicate="keep")
+
+
+def test_move_to_one_record_per_line_adds_no_versions(repo, tmp_path):
+    # Records already in canonical order, so only the layout changes
+    snapshots = [[canonical_mod(mod) for mod in snapshot] for snapshot in history(6)]
+    for snapshot in snapshots[:3]:
+        repo.commit(snapshot, layout="pretty")
+    # Same records, rewritten in the new layout
+    repo.commit(snapshots[2], layout="lines")
+    for snapshot in snapshots[3:]:
+        repo.commit(snapshot, layout="lines")
+    db_path = tmp_path / "mods.db"
+
+    run(repo, db_path)
+
+    expected = DataRepo(str(tmp_path / "lines"))
+    for snapshot in snapshots:
+        expected.commit(snapshot, layout="lines")
+    run(expected, tmp_path / "lines.db")
+    rows, expected_rows = dump(db_path), dump(tmp_path / "lines.db")
+    reformatted = rows["commits"][3][0]
+    assert all(commit_at != reformatted for commit_at, *_ in rows["versions"])
+    assert rows["items"] == expected_rows["items"]
+    assert len(rows["versions"]) == len(expected_rows["versions"])
+
+
+@pytest.mark.parametrize("layout", ["pretty", "lines"])
+def test_workers_match_a_serial_run(repo, tmp_path, layout):
+    # More commits than one chunk, so the snapshots are spread over workers
+    for snapshot in history(3 * ingest_module.CHUNK_SIZE + 5):
+        repo.commit(snapshot, layout=layout)
+
+    run(repo, tmp_path / "serial.db", workers=1)
+    run(repo, tmp_path / "parallel.db", workers=4)
+
+    assert dump(tmp_path / "parallel.db") == dump(tmp_path / "serial.db")
+
+
+def test_sharded_store_matches_data_json(repo, tmp_path):
+    snapshots = history(10)
+    for snapshot in snapshots:
+        repo.commit(snapshot, layout="store", data_path="data")
+    expected = DataRepo(str(tmp_path / "lines"))
+    for snapshot in snapshots:
+        expected.commit(snapshot)
+
+    stats = run(repo, tmp_path / "store.db", data_path="data")
+
+    run(expected, tmp_path / "lines.db")
+    assert stats.commits == len(snapshots)
+    assert dump(tmp_path / "store.db") == dump(tmp_path / "lines.db")
+
+
+def test_platform_cutover_seeds_every_backfilled_mod(repo, tmp_path):
+    def old_mod(mod_id: int, platforms: tuple[str, ...], date_updated: int) -> dict:
+        mod = make_mod(mod_id, date_updated, platforms)
+        mod["date_added"] = FIRST_COMMIT_AT - 86400
+        return mod
+
+    output = f"{repo.path}/data.json"
+    ps5_mods = [old_mod(mod_id, ("ps5",), 1750000000 + mod_id) for mod_id in range(1, 251)]
+    server = ModioServer(ps5_mods).start()
+    try:
+        scrape.scrape(server.url, "key", output)
+        repo.commit(scrape.load_data(output).values())
+
+        # The scrape is widened: Xbox-only mods that were on mod.io all along
+        # appear, three of them updated since the last snapshot, plus one new
+        server.mods += [
+            old_mod(mod_id, ("xboxseriesx",), 1700000000 + mod_id)
+            for mod_id in range(301, 331)
+        ]
+        for mod in server.mods[-3:]:
+            mod["date_updated"] += 60000000
+        new_mod = make_mod(400, platforms=("xboxseriesx",))
+        new_mod["date_added"] = FIRST_COMMIT_AT + 1800
+        server.mods.append(new_mod)
+        # The hourly run asks for a delta, which would only find those three
+        widened = scrape.scrape(server.url, "key", output, full=False)
+        repo.commit(scrape.load_data(output).values())
+
+        server.mods[260]["platforms"][0]["modfile_live"] += 1
+        server.mods[260]["date_updated"] = 1800000000
+        delta = scrape.scrape(server.url, "key", output, full=False)
+        repo.commit(scrape.load_data(output).values())
+        # The nightly full sweep, plus a mod added after the cutover
+        scrape.scrape(server.url, "key", output, full=True)
+        repo.commit([*scrape.load_data(output).values(), snapshot_mod(500)])
+    finally:
+        server.stop()
+    db_path = tmp_path / "mods.db"
+
+    stats = run(repo, db_path)
+
+    assert stats.items_backfilled == 30
+    events = [
+        (mod_id, kind, platform)
+        for mod_id, _, kind, platform, _, _ in dump(db_path)["events"]
+        if mod_id > 300
+    ]
+    assert events == [
+        (311, "updated", "xboxseriesx"),
+        (400, "added", "xboxseriesx"),
+        (500, "added", "ps5"),
+    ]
+    assert (widened.mode, delta.mode) == ("full", "delta")
@@ -0,0 +1,103 @@
+import pytest
+
+from scripts import scrape
+from scripts.scrape import MAX_RETRIES, RateLimiter, Scraper
+
+from .modio_server import ModioServer, make_mod
+
+
+@pytest.fixture
+def no_jitter(monkeypatch):
+    """Make backoff delays deterministic and short: the top of each jitter range."""
+    monkeypatch.setattr(scrape, "BACKOFF_BASE", 0.05)
+    monkeypatch.setattr(scrape.random, "uniform", lambda low, high: high)
+
+
+def test_requests_are_paced_by_the_quota():
+    server = ModioServer([make_mod(mod_id) for mod_id in range(1, 1001)]).start()
+    try:
+        scraper = Scraper(server.url, "key", concurrency=1)
+        scraper.limiter = RateLimiter(limit=5, window=1.0)
+
+        mods, stats = scraper.scrape()
+    finally:
+        server.stop()
+
+    # Five requests from the full bucket, then five more at five per second
+    assert len(mods) == 1000
+    assert stats.pages == 10
+    assert stats.rate_wait == pytest.approx(1.0, abs=0.3)
+    assert stats.seconds >= stats.rate_wait
+
+
+def test_server_quota_overrides_the_bucket(modio):
+    modio.headers = {
+        "X-RateLimit-Limit": "60",
+        "X-RateLimit-Remaining": "0",
+        "X-RateLimit-RetryAfter": "1",
+    }
+
+    def quota_reset(request: int) -> None:
+        if request > 1:
+            modio.headers.clear()
+
+    modio.on_request = quota_reset
+
+    mods, stats = Scraper(modio.url, "key", concurrency=1).scrape()
+
+    # The first page used up the quota; the rest waits out the reset, plus a second
+    assert len(mods) == 250
+    assert stats.throttled == 0
+    assert stats.rate_wait == pytest.approx(2.0, abs=0.3)
+
+
+@pytest.mark.parametrize("header", ["Retry-After", "X-RateLimit-RetryAfter"])
+def test_429_waits_for_retry_after(modio, header):
+    modio.responses.append((429, {header: "1"}))
+
+    mods, stats = Scraper(modio.url, "key", concurrency=1).scrape()
+
+    assert len(mods) == 250
+    assert stats.throttled == 1
+    assert stats.retries == 0
+    assert stats.rate_wait == pytest.approx(2.0, abs=0.3)
+    assert len(modio.requests) == 4
+
+
+def test_server_errors_back_off_and_retry(modio, no_jitter):
+    modio.responses.extend([(503, {}), (500, {})])
+
+    mods, stats = Scraper(modio.url, "key", concurrency=1).scrape()
+
+    assert len(mods) == 250
+    assert stats.retries == 2
+    assert stats.backoff_wait == pytest.approx(0.05 + 0.1)
+    assert stats.throttled == 0
+
+
+def test_server_errors_give_up_after_max_retries(modio, no_jitter):
+    modio.responses.extend([(503, {})] * (MAX_RETRIES + 1))
+
+    with pytest.raises(RuntimeError, match="Giving up"):
+        Scraper(modio.url, "key").scrape()
+    assert len(modio.requests) == MAX_RETRIES + 1
+
+
+def test_client_errors_are_not_retried(modio):
+    modio.responses.append((403, {}))
+
+    with pytest.raises(RuntimeError, match="Error 403"):
+        Scraper(modio.url, "key").scrape()
+    assert len(modio.requests) == 1
+
+
+def test_waits_are_reported(modio, no_jitter, monkeypatch, tmp_path, capsys):
+    monkeypatch.setenv("URL_TO_SCRAPE", modio.url)
+    monkeypatch.setenv("API_KEY", "key")
+    modio.responses.extend([(503, {}), (429, {"Retry-After": "0"})])
+
+    scrape.main([str(tmp_path / "data.json"), "--full", "--no-cache"])
+
+    out = capsys.readouterr().out
+    assert "Finished full scrape. 250 mods from 3 pages" in out
+    assert "0.1s backing off (1 retries, 1 429s)" in out
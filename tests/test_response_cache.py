@@ -0,0 +1,122 @@
+import pytest
+
+from scripts import scrape
+from scripts.scrape import CachedPage, ResponseCache, Scraper
+
+
+@pytest.fixture
+def projections(monkeypatch):
+    """Count the records projected, to tell cache hits from fresh pages."""
+    calls = []
+    project_mod = scrape.project_mod
+
+    def counting(mod: dict) -> dict:
+        calls.append(mod["id"])
+        return project_mod(mod)
+
+    monkeypatch.setattr(scrape, "project_mod", counting)
+    return calls
+
+
+def cached_files(directory) -> list:
+    return [path for path in directory.iterdir() if path.name != ResponseCache.INDEX]
+
+
+def test_warm_run_answers_every_page_from_the_cache(modio, tmp_path, projections):
+    output, cache = tmp_path / "data.json", tmp_path / "cache"
+    cold = scrape.scrape(modio.url, "key", str(output), cache_dir=str(cache))
+    first = output.read_bytes()
+    projections.clear()
+
+    warm = scrape.scrape(modio.url, "key", str(output), cache_dir=str(cache))
+
+    assert (cold.cache_hits, cold.cache_misses) == (0, 3)
+    assert (warm.cache_hits, warm.cache_misses) == (3, 0)
+    assert modio.not_modified == 3
+    assert projections == []
+    assert output.read_bytes() == first
+
+
+def test_last_modified_is_sent_without_an_etag(modio, tmp_path):
+    modio.etags = False
+    scrape.scrape(modio.url, "key", str(tmp_path / "data.json"), cache_dir=str(tmp_path))
+
+    warm = scrape.scrape(modio.url, "key", str(tmp_path / "data.json"), cache_dir=str(tmp_path))
+
+    assert modio.not_modified == 3
+    assert warm.cache_hits == 3
+
+
+def test_identical_body_is_a_hit_without_a_304(modio, tmp_path, projections):
+    modio.conditional = False
+    scrape.scrape(modio.url, "key", str(tmp_path / "data.json"), cache_dir=str(tmp_path))
+    projections.clear()
+
+    warm = scrape.scrape(
+        modio.url, "other-key", str(tmp_path / "data.json"), cache_dir=str(tmp_path)
+    )
+
+    # The API key is not part of the cache key, so a new key still hits
+    assert modio.not_modified == 0
+    assert (warm.cache_hits, warm.cache_misses) == (3, 0)
+    assert projections == []
+
+
+def test_changed_page_is_projected_again(modio, tmp_path, projections):
+    output = tmp_path / "data.json"
+    scrape.scrape(modio.url, "key", str(output), cache_dir=str(tmp_path / "cache"))
+    modio.mods[149]["name"] = "Renamed"
+    projections.clear()
+
+    warm = scrape.scrape(modio.url, "key", str(output), cache_dir=str(tmp_path / "cache"))
+
+    assert (warm.cache_hits, warm.cache_misses) == (2, 1)
+    assert projections == list(range(101, 201))
+    assert scrape.load_data(str(output))[150]["name"] == "Renamed"
+
+
+def test_save_evicts_least_recently_used(tmp_path):
+    cache = ResponseCache(str(tmp_path))
+    records = [{"id": 1, "name": "Mod 1"}]
+    for key in ("a", "b", "c"):
+        cache.put(key, CachedPage(etag=key), records)
+    size = cache.entries["a"].size
+    cache.entries["a"].used, cache.entries["b"].used, cache.entries["c"].used = 1.0, 3.0, 2.0
+    cache.max_bytes = 2 * size
+
+    cache.save()
+
+    reloaded = ResponseCache(str(tmp_path))
+    assert sorted(reloaded.entries) == ["b", "c"]
+    assert reloaded.get("a") is None
+    assert reloaded.load("b", reloaded.get("b")) == records
+    assert len(cached_files(tmp_path)) == 2
+
+
+def test_small_cache_keeps_what_fits(modio, tmp_path):
+    def run(max_bytes: int):
+        cache = ResponseCache(str(tmp_path), max_bytes=max_bytes)
+        return Scraper(modio.url, "key", cache=cache).scrape()[1]
+
+    # Nothing fits in one byte, so every page is evicted on save
+    assert run(1).cache_misses == 3
+    assert cached_files(tmp_path) == []
+    run(scrape.CACHE_MAX_BYTES)
+    page_size = max(path.stat().st_size for path in cached_files(tmp_path))
+
+    # Room for one page: this run still hits every page, then keeps one
+    warm = run(page_size)
+
+    assert (warm.cache_hits, warm.cache_misses) == (3, 0)
+    assert len(cached_files(tmp_path)) == 1
+    assert len(ResponseCache(str(tmp_path)).entries) == 1
+    after = run(page_size)
+    assert (after.cache_hits, after.cache_misses) == (1, 2)
+
+
+def test_unreadable_index_is_a_cold_cache(modio, tmp_path):
+    (tmp_path / ResponseCache.INDEX).write_text("{not json")
+
+    stats = scrape.scrape(modio.url, "key", str(tmp_path / "data.json"), cache_dir=str(tmp_path))
+
+    assert (stats.cache_hits, stats.cache_misses) == (0, 3)
@@ -0,0 +1,118 @@
+import json
+
+from scripts import scrape
+from scripts.scrape import PAGE_LIMIT, Scraper
+
+from .modio_server import make_mod
+
+
+def test_full_scrape_fetches_every_page(modio):
+    mods, stats = Scraper(modio.url, "key").scrape()
+
+    assert sorted(mods) == list(range(1, 251))
+    assert stats.pages == 3
+    assert stats.records == 250
+    offsets = sorted(int(query["_offset"]) for query in modio.requests)
+    assert offsets == [0, 100, 200]
+    assert all(query["_limit"] == str(PAGE_LIMIT) for query in modio.requests)
+    assert all(query["api_key"] == "key" for query in modio.requests)
+
+
+def test_full_scrape_without_total_stops_at_short_page(modio):
+    modio.report_total = False
+
+    mods, stats = Scraper(modio.url, "key", concurrency=1).scrape()
+
+    assert len(mods) == 250
+    assert stats.pages == 3
+
+
+def test_records_are_projected(modio):
+    mods, _ = Scraper(modio.url, "key").scrape()
+
+    mod = mods[1]
+    assert "media" not in mod
+    assert "download" not in mod["modfile"]
+    assert mod["submitted_by"]["profile_img_100x100_url"] == "https://img/avatar.png"
+
+
+def test_duplicate_ids_keep_the_first_record(modio):
+    duplicate = make_mod(5)
+    duplicate["name"] = "Duplicate"
+    modio.mods.append(duplicate)
+
+    mods, stats = Scraper(modio.url, "key").scrape()
+
+    assert stats.records == 251
+    assert stats.mods == 250
+    assert mods[5]["name"] == "Mod 5"
+
+
+def test_delta_scrape_stops_at_watermark(modio):
+    watermark = 1764000000 + 230
+
+    mods, stats = Scraper(modio.url, "key").scrape(watermark)
+
+    # Paging stops after the first page with nothing at or past the watermark
+    assert stats.mode == "delta"
+    assert stats.pages == 2
+    assert all(query["_sort"] == "-date_updated" for query in modio.requests)
+    assert sorted(mods) == list(range(51, 251))
+
+
+def test_data_json_is_byte_stable(modio, tmp_path):
+    output = tmp_path / "data.json"
+    scrape.scrape(modio.url, "key", str(output))
+    first = output.read_bytes()
+
+    # The API does not fix key or array order
+    for mod in modio.mods:
+        mod["tags"].reverse()
+        mod["platforms"].reverse()
+        mod["modfile"] = dict(reversed(mod["modfile"].items()))
+    modio.mods.reverse()
+    scrape.scrape(modio.url, "key", str(output))
+    assert output.read_bytes() == first
+
+    # A delta run that finds nothing new leaves the file as it was
+    scrape.scrape(modio.url, "key", str(output), full=False)
+    assert output.read_bytes() == first
+
+    lines = first.decode("utf-8").splitlines()
+    assert lines[0] == "[" and lines[-1] == "]"
+    assert [json.loads(line.rstrip(","))["id"] for line in lines[1:-1]] == list(range(1, 251))
+
+
+def test_delta_scrape_merges_changed_mods(modio, tmp_path):
+    output = tmp_path / "data.json"
+    scrape.scrape(modio.url, "key", str(output))
+    modio.mods[9]["date_updated"] += 10_000
+    modio.mods[9]["name"] = "Renamed"
+    modio.mods.append(make_mod(300, date_updated=1764100000))
+
+    stats = scrape.scrape(modio.url, "key", str(output), full=False)
+
+    data = scrape.load_data(str(output))
+    assert stats.pages == 2
+    assert len(data) == 251
+    assert data[10]["name"] == "Renamed"
+    assert data[300]["name"] == "Mod 300"
+
+
+def test_full_scrape_sorts_by_id(modio):
+    Scraper(modio.url, "key").scrape()
+
+    assert {query["_sort"] for query in modio.requests} == {"id"}
+
+
+def test_full_scrape_keeps_mods_updated_mid_sweep(modio):
+    def touch(request: int) -> None:
+        # Newest-first paging would push every later mod down one place
+        if request == 2:
+            modio.mods[50]["date_updated"] = 1765000000
+
+    modio.on_request = touch
+
+    mods, _ = Scraper(modio.url, "key", concurrency=1).scrape()
+
+    assert sorted(mods) == list(range(1, 251))
@@ -0,0 +1,108 @@
+import json
+import shutil
+import subprocess
+
+import pytest
+
+from scripts.changelog_data import Mod, ModUpdate
+from scripts.components.search import search_script
+from scripts.search_index import build_search_index, tokenize
+
+TEXTS = [
+    ("Mod 5 alpha", "Adds a 5th slot"),
+    ("Mod 50 Alpha", None),
+    ("Mod 5 beta", "A B C"),
+    ("Karlach's Armour", "Karlach's gear, retextured"),
+    ("Karlach Tweaks", "x2 damage for S-tier builds"),
+    ("Shadowheart", "Sharran_robes v1.2"),
+    ("Café Crème", "Ünïcode naïve façade – 東京 ２０２４"),
+    ("I", "a"),
+]
+
+QUERIES = [
+    "Mod 5 Alpha",
+    "mod 5",
+    "5 mod",
+    "Mod 50",
+    "karlach's",
+    "karlach s",
+    "s",
+    "a b",
+    "x2",
+    "sharran_robes",
+    "v1 2",
+    "CAFÉ",
+    "naïve façade",
+    "東京",
+    "２０２４",
+    "i a",
+    "",
+    "  ,.  ",
+]
+
+pytestmark = pytest.mark.skipif(shutil.which("node") is None, reason="needs node")
+
+
+def run_search_script(index: dict, queries: list[str]) -> list[dict]:
+    """Run the page's search functions in node; returns tokens and matches per query."""
+    script = search_script().strip().removeprefix("<script>").removesuffix("</script>")
+    program = f"""
+        globalThis.document = {{ addEventListener() {{}} }};
+        {script}
+        const index = {json.dumps(index)};
+        const queries = {json.dumps(queries)};
+        console.log(JSON.stringify(queries.map(query => ({{
+            tokens: searchTokens(query),
+            matches: searchMods(index, query),
+        }}))));
+    """
+    result = subprocess.run(
+        ["node", "-"], input=program, capture_output=True, text=True, check=True
+    )
+    return json.loads(result.stdout)
+
+
+@pytest.fixture(scope="module")
+def mods() -> list[Mod]:
+    return [
+        Mod(item_id, name, summary, updates=[ModUpdate(1764000000 + item_id, "added", 1)])
+        for item_id, (name, summary) in enumerate(TEXTS, 1)
+    ]
+
+
+def test_script_splits_queries_like_the_index(mods):
+    results = run_search_script(build_search_index(mods), QUERIES)
+
+    assert [result["tokens"] for result in results] == [tokenize(query) for query in QUERIES]
+
+
+def test_search_finds_every_mod_whose_tokens_match(mods):
+    index = build_search_index(mods)
+    positions = {row[0]: position for position, row in enumerate(index["mods"])}
+
+    results = run_search_script(index, QUERIES)
+
+    for query, result in zip(QUERIES, results):
+        terms = tokenize(query)
+        expected = sorted(
+            positions[mod.item_id]
+            for mod in mods
+            if terms
+            and all(
+                any(token.startswith(term) for token in tokenize(f"{mod.name} {mod.summary or ''}"))
+                for term in terms
+            )
+        )
+        assert result["matches"] == expected, query
+
+
+def test_exact_text_always_matches(mods):
+    index = build_search_index(mods)
+    texts = [text for name, summary in TEXTS for text in (name, summary) if text]
+
+    results = run_search_script(index, texts)
+
+    for text, result in zip(texts, results):
+        matched = {index["mods"][position][0] for position in result["matches"]}
+        owners = {mod.item_id for mod in mods if text in (mod.name, mod.summary)}
+        assert owners <= matched, text